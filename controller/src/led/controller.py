@@ -55,12 +55,11 @@ class LEDController:
             non_black = np.any(frame > 0, axis=1).sum()
             logger.debug(f"Number of non-black pixels: {non_black}")
 
-            # Update pixels
-            for i in range(len(frame)):
-                r, g, b = frame[i]
-                if r > 0 or g > 0 or b > 0:  # Log non-black pixels
-                    logger.debug(f"Setting pixel {i} to R:{r} G:{g} B:{b}")
-                self.strip.setPixelColor(i, Color(g, r, b))  # Note: GRB order
+            # Pack every pixel as Color(g, r, b) in one pass, then set plain ints
+            channels = frame.astype(np.uint32)
+            packed = (channels[:, 1] << 16) | (channels[:, 0] << 8) | channels[:, 2]
+            for i, color in enumerate(packed.tolist()):
+                self.strip.setPixelColor(i, color)  # Note: GRB order
 
             # Show the frame
             self.strip.show()
@@ -72,8 +71,7 @@ class LEDController:
 
     def clear(self) -> None:
         """Turn off all LEDs"""
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, Color(0, 0, 0))
+        self.strip[:] = Color(0, 0, 0)  # Slice assignment sets every pixel
         self.strip.show()
         logger.debug("Cleared all LEDs")
 
@@ -118,6 +118,13 @@ class CommandQueue:
                 pass
         logger.info("Command queue processor stopped")
 
+    async def clear(self) -> None:
+        """Drop all pending commands"""
+        for queue in self.queues.values():
+            while not queue.empty():
+                queue.get_nowait()
+        logger.debug("Command queues cleared")
+
     async def _process_commands(self) -> None:
         """Process commands from queues based on priority"""
         while self._running:
@@ -84,6 +84,8 @@ class SystemController:
 
         # Initialize pattern engine
         self.pattern_engine = PatternEngine(num_leds=config.led.count)
+        self._black_frame = np.zeros((config.led.count, 3), dtype=np.uint8)
+        self._black_frame.flags.writeable = False
 
         # Command queue
         self.command_queue = CommandQueue(self.state_manager.transaction_manager)
@@ -188,12 +190,19 @@ class SystemController:
             logger.error(f"Error during shutdown: {e}")
             raise
 
+    async def reset(self) -> None:
+        """Reset queued commands, errors, state and patterns for reuse"""
+        await self.command_queue.clear()
+        await self.pattern_engine.reset()
+        await self.state_manager.reset()
+
     async def _update_loop(self) -> None:
         """Main update loop"""
         consecutive_errors = 0
         last_error_time = 0.0
         ERROR_THRESHOLD = 10
         ERROR_RESET_TIME = 5.0  # seconds
+        next_frame_time = time.perf_counter()
 
         try:
             while not self.shutdown_event.is_set():
@@ -234,8 +243,15 @@ class SystemController:
                     # Reset error count on successful iteration
                     consecutive_errors = 0
 
-                    # Maintain target frame rate
-                    await asyncio.sleep(1 / self.config.performance.target_fps)
+                    # Maintain target frame rate against a fixed deadline so the
+                    # time spent on this frame doesn't stretch the period
+                    next_frame_time += 1 / self.config.performance.target_fps
+                    delay = next_frame_time - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        # Behind schedule, resync rather than burst to catch up
+                        next_frame_time = time.perf_counter()
 
                 except Exception as e:
                     consecutive_errors += 1
@@ -283,7 +299,7 @@ class SystemController:
             # Check if we have an active pattern
             if not self.pattern_engine.current_pattern:
                 # Return black frame if no pattern is active
-                return np.zeros((self.config.led.count, 3), dtype=np.uint8)
+                return self._black_frame
 
             # Generate frame with timing
             start_time = time.perf_counter()
@@ -312,11 +328,8 @@ class SystemController:
             self.state_manager.performance.record_error(error_msg)
 
             # Return last valid frame or black frame
-            return getattr(
-                self.pattern_engine,
-                "_last_valid_frame",
-                np.zeros((self.config.led.count, 3), dtype=np.uint8),
-            )
+            last_frame = getattr(self.pattern_engine, "_last_valid_frame", None)
+            return last_frame if last_frame is not None else self._black_frame
 
     @asynccontextmanager
     async def pause(self):
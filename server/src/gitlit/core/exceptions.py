@@ -1,13 +1,4 @@
-class ValidationError(Exception):
-    """Pattern validation error"""
-
-    pass
-
-
-class PatternError(Exception):
-    """Pattern execution error"""
-
-    pass
+from ..common.exceptions import PatternError, ValidationError
 
 
 class AudioError(Exception):
@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import time
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import Optional, Dict, Any, Deque, List
 import numpy as np
 from dataclasses import dataclass, field
 
@@ -14,7 +15,7 @@ from .timing import TimeState
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameMetrics:
     """Metrics for frame generation and timing"""
 
@@ -26,40 +27,63 @@ class FrameMetrics:
     dropped_frames: int = 0
     buffer_usage: float = 0.0  # 0-1 representing buffer fullness
 
+    def copy_from(self, other: "FrameMetrics") -> None:
+        """Overwrite these metrics in place with another instance's values"""
+        for name in self.__slots__:
+            setattr(self, name, getattr(other, name))
+
 
 @dataclass
 class FrameBuffer:
     """Double/Triple buffering implementation for smooth frame delivery"""
 
     size: int = SystemDefaults.DEFAULT_BUFFER_SIZE
-    frames: List[np.ndarray] = field(default_factory=list)
-    metrics: List[FrameMetrics] = field(default_factory=list)
+    frames: Optional[np.ndarray] = None  # (size, num_leds, 3) ring storage
+    metrics: List[FrameMetrics] = field(default_factory=list)  # Pooled per slot
     read_index: int = 0
     write_index: int = 0
 
     def __post_init__(self):
-        """Initialize buffer with empty frames"""
+        """Initialize buffer metrics, frame storage is sized on first write"""
         if self.size < 1:
             raise ValidationError("Buffer size must be at least 1")
-        self.frames = [None] * self.size
         self.metrics = [FrameMetrics() for _ in range(self.size)]
 
     def write_frame(self, frame: np.ndarray, metrics: FrameMetrics) -> bool:
-        """Write frame to buffer, returns False if buffer is full"""
+        """Copy frame and metrics into the next ring slot, returns False if full"""
         if self.is_full():
             return False
-        self.frames[self.write_index] = frame.copy()
-        self.metrics[self.write_index] = metrics
+        if self.frames is None or self.frames.shape[1:] != frame.shape:
+            self.frames = np.zeros((self.size,) + frame.shape, dtype=np.uint8)
+        np.copyto(self.frames[self.write_index], frame, casting="unsafe")
+        self.metrics[self.write_index].copy_from(metrics)
         self.write_index = (self.write_index + 1) % self.size
         return True
 
+    def write_frames(self, frames: np.ndarray, metrics: List[FrameMetrics]) -> int:
+        """Copy a (k, num_leds, 3) stack into the ring, returns frames written"""
+        count = min(len(frames), self.size - 1 - self.get_used())
+        if count <= 0:
+            return 0
+        if self.frames is None or self.frames.shape[1:] != frames.shape[1:]:
+            self.frames = np.zeros((self.size,) + frames.shape[1:], dtype=np.uint8)
+        slots = (self.write_index + np.arange(count)) % self.size
+        self.frames[slots] = frames[:count]
+        for slot, frame_metrics in zip(slots.tolist(), metrics[:count]):
+            self.metrics[slot].copy_from(frame_metrics)
+        self.write_index = (self.write_index + count) % self.size
+        return count
+
     def read_frame(self) -> tuple[Optional[np.ndarray], Optional[FrameMetrics]]:
-        """Read frame from buffer, returns (None, None) if buffer is empty"""
+        """Read frame from buffer, returns (None, None) if buffer is empty
+
+        The frame and metrics belong to their ring slot and stay valid until
+        the writer wraps around to that slot again.
+        """
         if self.is_empty():
             return None, None
         frame = self.frames[self.read_index]
         metrics = self.metrics[self.read_index]
-        self.frames[self.read_index] = None
         self.read_index = (self.read_index + 1) % self.size
         return frame, metrics
 
@@ -71,20 +95,27 @@ class FrameBuffer:
         """Check if buffer is full"""
         return ((self.write_index + 1) % self.size) == self.read_index
 
+    def get_used(self) -> int:
+        """Get number of buffered frames"""
+        if self.read_index <= self.write_index:
+            return self.write_index - self.read_index
+        return self.size - (self.read_index - self.write_index)
+
     def get_usage(self) -> float:
         """Get buffer usage as percentage"""
-        if self.read_index <= self.write_index:
-            used = self.write_index - self.read_index
-        else:
-            used = self.size - (self.read_index - self.write_index)
-        return used / self.size
+        return self.get_used() / self.size
 
 
 class FrameManager:
     """Manages frame generation, buffering, and timing"""
 
-    def __init__(self, num_leds: int, target_fps: int):
-        """Initialize frame manager"""
+    def __init__(
+        self,
+        num_leds: int,
+        target_fps: int,
+        buffer_size: int = SystemDefaults.DEFAULT_BUFFER_SIZE,
+    ):
+        """Initialize frame manager, buffering up to buffer_size - 1 frames"""
         self.num_leds = num_leds
         self.target_fps = target_fps
         self.frame_time_ms = 1000 / target_fps
@@ -93,8 +124,10 @@ class FrameManager:
         )  # 90% of frame time for processing
 
         # Buffers for smooth frame delivery
-        self.primary_buffer = FrameBuffer()
+        self.primary_buffer = FrameBuffer(size=buffer_size)
         self.emergency_frame = np.zeros((num_leds, 3), dtype=np.uint8)
+        self.emergency_frame.flags.writeable = False  # Shared, never copied
+        self._write_metrics = FrameMetrics()  # Reused when writers pass no metrics
 
         # State
         self.running = False
@@ -103,10 +136,10 @@ class FrameManager:
         self.last_frame_time = 0
         self.time_state = TimeState()
 
-        # Performance monitoring
-        self.generation_times: List[float] = []
-        self.transfer_times: List[float] = []
-        self.frame_intervals: List[float] = []
+        # Performance monitoring, rolling windows over the last 60 frames
+        self.generation_times: Deque[float] = deque(maxlen=60)
+        self.transfer_times: Deque[float] = deque(maxlen=60)
+        self.frame_intervals: Deque[float] = deque(maxlen=60)
 
     async def start(self) -> None:
         """Start frame manager"""
@@ -122,7 +155,7 @@ class FrameManager:
         """Stop frame manager"""
         self.running = False
         # Clear buffers
-        self.primary_buffer = FrameBuffer()
+        self.primary_buffer = FrameBuffer(size=self.primary_buffer.size)
         logger.info("Frame manager stopped")
 
     async def generate_frame(
@@ -148,8 +181,6 @@ class FrameManager:
             # Update metrics
             self.frame_count += 1
             self.generation_times.append(generation_time)
-            if len(self.generation_times) > 60:
-                self.generation_times.pop(0)
 
             # Create frame metrics
             metrics = FrameMetrics(
@@ -171,16 +202,29 @@ class FrameManager:
         except Exception as e:
             logger.error(f"Frame generation failed: {e}")
             self.dropped_frames += 1
-            return self.emergency_frame.copy(), FrameMetrics(
+            return self.emergency_frame, FrameMetrics(
                 dropped_frames=self.dropped_frames, frame_number=self.frame_count
             )
 
-    async def write_frame(self, frame: np.ndarray, metrics: FrameMetrics) -> bool:
-        """Write frame to buffer"""
+    def _current_metrics(self) -> FrameMetrics:
+        """Stamp the reusable write metrics with the current frame state"""
+        metrics = self._write_metrics
+        metrics.frame_number = self.frame_count
+        metrics.timestamp = self.time_state.time_ms
+        metrics.dropped_frames = self.dropped_frames
+        metrics.buffer_usage = self.primary_buffer.get_usage()
+        return metrics
+
+    async def write_frame(
+        self, frame: np.ndarray, metrics: Optional[FrameMetrics] = None
+    ) -> bool:
+        """Write frame to buffer, stamping current metrics if none are given"""
         if not self.running:
             return False
 
         # Try to write to primary buffer
+        if metrics is None:
+            metrics = self._current_metrics()
         if not self.primary_buffer.write_frame(frame, metrics):
             self.dropped_frames += 1
             logger.warning("Frame dropped: Buffer full")
@@ -188,6 +232,23 @@ class FrameManager:
 
         return True
 
+    async def write_frames_batch(
+        self, frames: np.ndarray, metrics: Optional[List[FrameMetrics]] = None
+    ) -> bool:
+        """Write a stack of frames to the buffer in one pass"""
+        if not self.running:
+            return False
+
+        if metrics is None:
+            metrics = [self._current_metrics()] * len(frames)
+        written = self.primary_buffer.write_frames(frames, metrics)
+        if written < len(frames):
+            self.dropped_frames += len(frames) - written
+            logger.warning(f"{len(frames) - written} frames dropped: Buffer full")
+            return False
+
+        return True
+
     async def read_frame(self) -> tuple[Optional[np.ndarray], FrameMetrics]:
         """Read next frame from buffer"""
         if not self.running:
@@ -197,7 +258,7 @@ class FrameManager:
         frame, metrics = self.primary_buffer.read_frame()
         if frame is None:
             logger.warning("Buffer underrun, using emergency frame")
-            return self.emergency_frame.copy(), FrameMetrics(
+            return self.emergency_frame, FrameMetrics(
                 dropped_frames=self.dropped_frames, frame_number=self.frame_count
             )
 
@@ -216,6 +216,22 @@ class SystemStateManager:
 
         logger.info("System stopping")
 
+    async def reset(self) -> None:
+        """Clear recorded errors and return to the ready state"""
+        self.performance.error_count = 0
+        self.performance.last_error_time = 0
+        self.performance.last_error_message = ""
+        if self.current_state == SystemState.READY:
+            return
+
+        async with TransactionContext(self.transaction_manager) as transaction:
+            transaction.add_change(
+                "system_state", self.current_state, SystemState.READY
+            )
+            transaction.on_commit = lambda: self._transition_to(SystemState.READY)
+
+        logger.info("System reset")
+
     def _transition_to(self, new_state: SystemState) -> None:
         """Handle state transition"""
         self.last_state = self.current_state
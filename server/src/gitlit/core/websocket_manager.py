@@ -17,6 +17,9 @@ class WebSocketManager:
         self._last_heartbeat = 0.0
         self._broadcast_task: Optional[asyncio.Task] = None
         self._running = False
+        # Interleaved RGB bytes sent to clients, reused across frames
+        self._frame_bytes = bytearray()
+        self._frame_bytes_view = np.frombuffer(self._frame_bytes, dtype=np.uint8)
 
     async def connect(self, websocket: WebSocket) -> None:
         """Handle new WebSocket connection"""
@@ -50,8 +53,16 @@ class WebSocketManager:
             return
 
         try:
-            # Convert frame to bytes only once
-            frame_data = frame.tobytes()
+            # Interleave frame into the reused byte buffer once per broadcast
+            if len(self._frame_bytes) != frame.size:
+                self._frame_bytes = bytearray(frame.size)
+                self._frame_bytes_view = np.frombuffer(
+                    self._frame_bytes, dtype=np.uint8
+                )
+            np.copyto(
+                self._frame_bytes_view.reshape(frame.shape), frame, casting="unsafe"
+            )
+            frame_data = self._frame_bytes
 
             # Prepare message with optional metadata
             message = {
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, ClassVar, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Union, ClassVar, Tuple
 import time
 import logging
 import numpy as np
@@ -138,17 +138,72 @@ class BasePattern(ABC):
     name: str = "base"
     description: str = "Base pattern class"
     parameters: ClassVar[List[Parameter]] = []
+    modifiable_attributes: ClassVar[List[ModifiableAttribute]] = []
 
-    def __init__(self, led_count: int):
-        """Initialize pattern"""
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        """Initialize pattern, optionally writing into a caller-owned buffer
+
+        Frames are stored planar: `frame_planes` is (3, led_count) with one
+        contiguous row per channel and `frame_buffer` is its transposed
+        (led_count, 3) view. `generate` hands callers a read-only view of
+        the same memory, so they must copy a frame to keep or modify it.
+        """
         self.led_count = led_count
         self.num_leds = led_count  # For backwards compatibility
-        self.frame_buffer = np.zeros((led_count, 3), dtype=np.uint8)
+        if frame_buffer is None:
+            frame_buffer = np.zeros((3, led_count), dtype=np.uint8).T
+        elif frame_buffer.shape != (led_count, 3) or frame_buffer.dtype != np.uint8:
+            raise PatternError(
+                f"Frame buffer must be ({led_count}, 3) uint8, "
+                f"got {frame_buffer.shape} {frame_buffer.dtype}"
+            )
+        self.frame_buffer = frame_buffer
+        self.frame_planes = frame_buffer.T
+        self._frame_view = frame_buffer.view()
+        self._frame_view.flags.writeable = False
+        # Planar fixed-point scratch for color scaling
+        self._scratch_u16 = np.empty((3, led_count), dtype=np.uint16)
+        # LED indices 0..led_count-1, shared by patterns instead of np.arange
+        self._led_index = np.arange(led_count)
         self.state = PatternState()
         self.state.cached_data = {}  # Initialize cached_data dict
         self.metrics = PatternMetrics()
         self.timing = TimeState()
 
+    def _scale_color(self, color: np.ndarray, brightness: np.ndarray) -> np.ndarray:
+        """Scale uint8 color(s) by per-LED brightness in Q0.8 fixed point
+
+        `color` is (3,) or (3, k) uint8 and `brightness` is (k,) in [0, 1].
+        Returns a (3, k) view into the scratch buffer holding 0-255 values.
+        """
+        k = brightness.shape[0]
+        bri_q8 = np.clip(brightness * 255.0, 0, 255).astype(np.uint16)
+        scaled = self._scratch_u16[:, :k]
+        np.multiply(color.reshape(3, -1), bri_q8, out=scaled)
+        # Exact x // 255 for x <= 255 * 255, so full scale stays 255
+        scaled += scaled >> 8
+        scaled += 1
+        scaled >>= 8
+        return scaled
+
+    def _mix_colors(
+        self, color1: np.ndarray, color2: np.ndarray, weight: np.ndarray
+    ) -> np.ndarray:
+        """Mix two colors by per-LED Q8 weights in fixed point
+
+        `color1` and `color2` are (3,) or (3, k) and `weight` is (k,) uint16
+        in [0, 256], where 0 is pure `color1`. Returns a (3, k) view into the
+        scratch buffer holding 0-255 values.
+        """
+        k = weight.shape[0]
+        mixed = self._scratch_u16[:, :k]
+        c1 = color1.reshape(3, -1).astype(np.uint16)
+        # c1 * 256 + (c2 - c1) * w wraps in uint16 but the result fits, so it's exact
+        np.multiply(color2.reshape(3, -1) - c1, weight, out=mixed)
+        mixed += c1 << 8
+        mixed >>= 8
+        return mixed
+
     @abstractmethod
     async def _generate(self, time_ms: float) -> np.ndarray:
         """Generate pattern frame"""
@@ -157,10 +212,58 @@ class BasePattern(ABC):
     async def generate(
         self, time_ms: float, params: Optional[Dict[str, Any]] = None
     ) -> np.ndarray:
-        """Public method to generate a frame"""
+        """Public method to generate a frame, borrowed read-only"""
+        if params:
+            self.state.parameters.update(params)
+        frame = await self._generate(time_ms)
+        return self._frame_view if frame is self.frame_buffer else frame
+
+    async def _generate_batch(self, times_ms: Sequence[float]) -> np.ndarray:
+        """Generate one frame per timestamp, stacked as (n, led_count, 3)"""
+        frames = np.empty((len(times_ms), self.led_count, 3), dtype=np.uint8)
+        for i, time_ms in enumerate(times_ms):
+            frames[i] = await self._generate(time_ms)
+        return frames
+
+    async def generate_batch(
+        self, times_ms: Sequence[float], params: Optional[Dict[str, Any]] = None
+    ) -> np.ndarray:
+        """Public method to generate several frames at once
+
+        Like generate(), the (n, led_count, 3) stack is borrowed read-only.
+        Static patterns broadcast their live frame buffer, so the batch is
+        only valid until the next generate() or generate_batch() call; copy
+        it to keep it.
+        """
         if params:
             self.state.parameters.update(params)
-        return await self._generate(time_ms)
+        frames = await self._generate_batch(times_ms)
+        frames.flags.writeable = False
+        return frames
+
+    async def update_parameters(self, params: Dict[str, Any]) -> None:
+        """Validate parameters against the pattern spec and store them
+
+        Unknown names and out-of-range values raise ValidationError, nothing
+        is stored unless every value is valid.
+        """
+        specs = {param.name: param for param in self.parameters}
+        validated = {}
+        for name, value in params.items():
+            spec = specs.get(name)
+            if spec is None:
+                raise ValidationError(f"Unknown parameter for {self.name}: {name}")
+            try:
+                value = spec.type(value)
+            except (ValueError, TypeError) as e:
+                raise ValidationError(f"Invalid value for {name}: {value} ({str(e)})")
+            if spec.min_value is not None and value < spec.min_value:
+                raise ValidationError(f"{name} must be >= {spec.min_value}")
+            if spec.max_value is not None and value > spec.max_value:
+                raise ValidationError(f"{name} must be <= {spec.max_value}")
+            validated[name] = value
+        self.state.parameters.update(validated)
+        self.state.metrics.parameter_updates += 1
 
     def get_state(self) -> Dict[str, Any]:
         """Get pattern state"""
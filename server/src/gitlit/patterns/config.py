@@ -1,5 +1,6 @@
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from .modifiers.base import BaseModifier
 
@@ -34,7 +35,7 @@ class PatternState:
     parameters: Dict[str, Any] = field(default_factory=dict)
     cached_data: Dict[str, Any] = field(default_factory=dict)
     is_transitioning: bool = False
-    frame_times: List[float] = field(default_factory=list)
+    frame_times: Deque[float] = field(default_factory=lambda: deque(maxlen=60))
     avg_frame_time: float = 0.0
 
     def get_normalized_time(self, time_ms: float) -> float:
@@ -49,10 +50,8 @@ class PatternState:
         self.last_frame_time = current_time
         self.frame_count += 1
 
-        # Update performance metrics
+        # Update performance metrics (deque keeps the last 60 frames)
         self.frame_times.append(self.delta_time)
-        if len(self.frame_times) > 60:  # Keep last 60 frames
-            self.frame_times.pop(0)
         if self.frame_times:
             self.avg_frame_time = sum(self.frame_times) / len(self.frame_times)
 
@@ -86,6 +86,9 @@ class TransitionState:
 class PatternEngine:
     """Manages patterns with improved state handling"""
 
+    # Pattern instances whose frame buffers live in the shared frame stack
+    max_pattern_slots: int = 16
+
     def __init__(self, num_leds: int):
         """Initialize pattern engine"""
         self.num_leds = num_leds
@@ -103,6 +106,12 @@ class PatternEngine:
         self.frame_buffer = np.zeros((num_leds, 3), dtype=np.uint8)
         self._last_valid_frame = None
 
+        # One contiguous planar block backing every pattern's frame buffer
+        self.frame_stack = np.zeros(
+            (self.max_pattern_slots, 3, num_leds), dtype=np.uint8
+        )
+        self._next_slot = 0
+
         # Timing constraints
         self.timing = TimingConstraints.from_config(num_leds)
 
@@ -118,11 +127,19 @@ class PatternEngine:
         self.default_transition = "crossfade"
         self.default_transition_duration_ms = 500.0
 
+    def _create_instance(self, pattern_class: Type[BasePattern]) -> BasePattern:
+        """Create a pattern instance backed by a slot of the frame stack"""
+        if self._next_slot >= self.max_pattern_slots:
+            return pattern_class(self.num_leds)
+        frame_buffer = self.frame_stack[self._next_slot].T
+        self._next_slot += 1
+        return pattern_class(self.num_leds, frame_buffer=frame_buffer)
+
     async def register_pattern(self, pattern_class: Type[BasePattern]) -> None:
         """Register a pattern class"""
         try:
             # Create test instance to validate pattern
-            test_instance = pattern_class(self.num_leds)
+            test_instance = self._create_instance(pattern_class)
             test_frame = await self._generate_test_frame(test_instance)
 
             if test_frame is not None:
@@ -164,7 +181,7 @@ class PatternEngine:
             # Get or create pattern instance
             new_pattern = self.pattern_instances.get(pattern_name)
             if new_pattern is None:
-                new_pattern = self.patterns[pattern_name](self.num_leds)
+                new_pattern = self._create_instance(self.patterns[pattern_name])
                 self.pattern_instances[pattern_name] = new_pattern
 
             # Update parameters if provided
@@ -233,7 +250,10 @@ class PatternEngine:
             if frame is not None:
                 if frame.shape != (self.num_leds, 3):
                     raise PatternError(f"Invalid frame shape: {frame.shape}")
-                self._last_valid_frame = frame.copy()
+                if self._last_valid_frame is None:
+                    self._last_valid_frame = frame.copy()
+                else:
+                    np.copyto(self._last_valid_frame, frame)
                 self.frame_buffer = frame
                 self.metrics.total_frames += 1
             else:
@@ -323,10 +343,25 @@ class PatternEngine:
         self.previous_pattern = None
         self.pattern_instances.clear()
         self.patterns.clear()
-        self.frame_buffer.fill(0)
+        self.frame_buffer = np.zeros((self.num_leds, 3), dtype=np.uint8)
+        self.frame_stack.fill(0)
+        self._next_slot = 0
         self._last_valid_frame = None
         logger.info("Pattern engine cleaned up")
 
+    async def reset(self) -> None:
+        """Drop active patterns, transitions and metrics, keeping registrations"""
+        self.current_pattern = None
+        self.previous_pattern = None
+        self.pattern_instances.clear()
+        self.transition_state = TransitionState()
+        self.metrics = EngineMetrics()
+        self.frame_buffer.fill(0)
+        self.frame_stack.fill(0)
+        self._next_slot = 0
+        self._last_valid_frame = None
+        logger.info("Pattern engine reset")
+
     async def get_available_patterns(self) -> List[Dict[str, Any]]:
         """Get available pattern definitions"""
         patterns = []
@@ -13,5 +13,5 @@ class BeatModifier(BaseModifier):
         intensity = params.get("beat_intensity", 1.0)
 
         if beat_active:
-            return (frame * intensity).astype(np.uint8)
+            return self._scale_frame(frame, intensity)
         return frame
@@ -10,4 +10,4 @@ class VolumeModifier(BaseModifier):
 
     def apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         volume = params.get("volume", 1.0)
-        return (frame * volume).astype(np.uint8)
+        return self._scale_frame(frame, volume)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 import numpy as np
 
@@ -23,11 +23,7 @@ class BaseModifier:
     def __init__(self):
         self.enabled = True
 
-    @classmethod
-    @property
-    def parameters(cls) -> List[ModifierSpec]:
-        """Get modifier parameters"""
-        return []
+    parameters: ClassVar[List[ModifierSpec]] = []
 
     def validate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and set defaults for parameters"""
@@ -51,6 +47,12 @@ class BaseModifier:
 
         return validated
 
+    def _scale_frame(self, frame: np.ndarray, factor: float) -> np.ndarray:
+        """Scale a frame into a new uint8 frame, keeping its channel-planar layout"""
+        scaled = np.empty_like(frame, dtype=np.uint8)
+        np.multiply(frame, factor, out=scaled, casting="unsafe")
+        return scaled
+
     def apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         """Apply modifier to frame"""
         if not self.enabled:
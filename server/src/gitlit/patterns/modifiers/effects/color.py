@@ -1,116 +1,129 @@
-import colorsys
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import numpy as np
 
 from ..base import BaseModifier, ModifierSpec
 
 
+def _rgb_to_hsv(frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert an (N, 3) RGB frame to HSV planes, matching colorsys.rgb_to_hsv"""
+    rgb = frame / 255.0
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    maxc = rgb.max(axis=1)
+    rangec = maxc - rgb.min(axis=1)
+    gray = rangec == 0
+    rangec[gray] = 1.0  # Hue and saturation are zero for grays anyway
+
+    s = np.where(gray, 0.0, rangec / np.where(gray, 1.0, maxc))
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(gray, 0.0, (h / 6.0) % 1.0)
+    return h, s, maxc
+
+
+def _hsv_to_rgb(h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Convert HSV planes to an (N, 3) uint8 frame, matching colorsys.hsv_to_rgb"""
+    i = (h * 6.0).astype(np.int64)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i %= 6
+
+    rgb = np.empty((len(h), 3))
+    rgb[:, 0] = np.choose(i, [v, q, p, p, t, v])
+    rgb[:, 1] = np.choose(i, [t, v, v, q, p, p])
+    rgb[:, 2] = np.choose(i, [p, p, t, v, v, q])
+    rgb *= 255
+    return rgb.astype(np.uint8)
+
+
 class ColorTempModifier(BaseModifier):
     """Adjust color temperature (warm/cool)"""
 
-    @classmethod
-    @property
-    def parameters(cls):
-        return [
-            ModifierSpec(
-                name="temperature",
-                type=float,
-                default=0.0,  # 0 = neutral, -1 = warm, +1 = cool
-                min_value=-1.0,
-                max_value=1.0,
-                description="Color temperature adjustment",
-            )
-        ]
+    parameters = [
+        ModifierSpec(
+            name="temperature",
+            type=float,
+            default=0.0,  # 0 = neutral, -1 = warm, +1 = cool
+            min_value=-1.0,
+            max_value=1.0,
+            description="Color temperature adjustment",
+        )
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         temp = params["temperature"]
         if temp == 0:
             return frame
 
-        # Convert RGB to HSV
-        hsv_frame = np.zeros_like(frame, dtype=float)
-        for i in range(len(frame)):
-            r, g, b = frame[i] / 255.0
-            h, s, v = colorsys.rgb_to_hsv(r, g, b)
-
-            # Adjust hue based on temperature
-            if temp > 0:  # Cooler
-                h = h * 0.8 + 0.6  # Shift toward blue
-            else:  # Warmer
-                h = h * 0.8 + 0.05  # Shift toward orange
+        # Convert RGB to HSV for the whole frame
+        h, s, v = _rgb_to_hsv(frame)
 
-            # Convert back to RGB
-            r, g, b = colorsys.hsv_to_rgb(h % 1.0, s, v)
-            frame[i] = np.array([r, g, b]) * 255
+        # Adjust hue based on temperature
+        if temp > 0:  # Cooler
+            h = h * 0.8 + 0.6  # Shift toward blue
+        else:  # Warmer
+            h = h * 0.8 + 0.05  # Shift toward orange
 
-        return frame.astype(np.uint8)
+        # Convert back to RGB
+        return _hsv_to_rgb(h % 1.0, s, v)
 
 
 class SaturationModifier(BaseModifier):
     """Adjust color saturation"""
 
-    @classmethod
-    @property
-    def parameters(cls):
-        return [
-            ModifierSpec(
-                name="saturation",
-                type=float,
-                default=1.0,
-                min_value=0.0,
-                max_value=2.0,
-                description="Color saturation multiplier",
-            )
-        ]
+    parameters = [
+        ModifierSpec(
+            name="saturation",
+            type=float,
+            default=1.0,
+            min_value=0.0,
+            max_value=2.0,
+            description="Color saturation multiplier",
+        )
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         sat_mult = params["saturation"]
         if sat_mult == 1.0:
             return frame
 
-        # Convert RGB to HSV
-        hsv_frame = np.zeros_like(frame, dtype=float)
-        for i in range(len(frame)):
-            r, g, b = frame[i] / 255.0
-            h, s, v = colorsys.rgb_to_hsv(r, g, b)
-
-            # Adjust saturation
-            s = min(1.0, s * sat_mult)
+        # Convert RGB to HSV for the whole frame
+        h, s, v = _rgb_to_hsv(frame)
 
-            # Convert back to RGB
-            r, g, b = colorsys.hsv_to_rgb(h, s, v)
-            frame[i] = np.array([r, g, b]) * 255
+        # Adjust saturation
+        np.minimum(s * sat_mult, 1.0, out=s)
 
-        return frame.astype(np.uint8)
+        # Convert back to RGB
+        return _hsv_to_rgb(h, s, v)
 
 
 class ColorCycleModifier(BaseModifier):
     """Alternate between two colors for patterns like chase"""
 
-    @classmethod
-    @property
-    def parameters(cls):
-        return [
-            ModifierSpec(
-                name="enabled",
-                type=bool,
-                default=False,
-                description="Enable color alternating",
-            ),
-            ModifierSpec(
-                name="color1",
-                type=tuple,
-                default=(255, 0, 0),  # Red
-                description="First color (RGB)",
-            ),
-            ModifierSpec(
-                name="color2",
-                type=tuple,
-                default=(0, 0, 255),  # Blue
-                description="Second color (RGB)",
-            ),
-        ]
+    parameters = [
+        ModifierSpec(
+            name="enabled",
+            type=bool,
+            default=False,
+            description="Enable color alternating",
+        ),
+        ModifierSpec(
+            name="color1",
+            type=tuple,
+            default=(255, 0, 0),  # Red
+            description="First color (RGB)",
+        ),
+        ModifierSpec(
+            name="color2",
+            type=tuple,
+            default=(0, 0, 255),  # Blue
+            description="Second color (RGB)",
+        ),
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         if not params["enabled"]:
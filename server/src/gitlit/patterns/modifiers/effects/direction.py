@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 import numpy as np
 
@@ -8,17 +8,14 @@ from ..base import BaseModifier, ModifierSpec
 class DirectionModifier(BaseModifier):
     """Reverse pattern direction"""
 
-    @classmethod
-    @property
-    def parameters(cls) -> List[ModifierSpec]:
-        return [
-            ModifierSpec(
-                name="reverse",
-                type=bool,
-                default=False,
-                description="Reverse pattern direction",
-            )
-        ]
+    parameters = [
+        ModifierSpec(
+            name="reverse",
+            type=bool,
+            default=False,
+            description="Reverse pattern direction",
+        )
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         if params["reverse"]:
@@ -8,22 +8,19 @@ from ..base import BaseModifier, ModifierSpec
 class MirrorModifier(BaseModifier):
     """Mirror pattern around center point"""
 
-    @classmethod
-    @property
-    def parameters(cls):
-        return [
-            ModifierSpec(
-                name="enabled", type=bool, default=False, description="Enable mirroring"
-            ),
-            ModifierSpec(
-                name="center",
-                type=float,
-                default=0.5,
-                min_value=0.0,
-                max_value=1.0,
-                description="Mirror center point",
-            ),
-        ]
+    parameters = [
+        ModifierSpec(
+            name="enabled", type=bool, default=False, description="Enable mirroring"
+        ),
+        ModifierSpec(
+            name="center",
+            type=float,
+            default=0.5,
+            min_value=0.0,
+            max_value=1.0,
+            description="Mirror center point",
+        ),
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         if not params["enabled"]:
@@ -58,27 +55,24 @@ class MirrorModifier(BaseModifier):
 class SegmentModifier(BaseModifier):
     """Show pattern only in specific segments"""
 
-    @classmethod
-    @property
-    def parameters(cls):
-        return [
-            ModifierSpec(
-                name="start",
-                type=float,
-                default=0.0,
-                min_value=0.0,
-                max_value=1.0,
-                description="Segment start position",
-            ),
-            ModifierSpec(
-                name="length",
-                type=float,
-                default=1.0,
-                min_value=0.0,
-                max_value=1.0,
-                description="Segment length",
-            ),
-        ]
+    parameters = [
+        ModifierSpec(
+            name="start",
+            type=float,
+            default=0.0,
+            min_value=0.0,
+            max_value=1.0,
+            description="Segment start position",
+        ),
+        ModifierSpec(
+            name="length",
+            type=float,
+            default=1.0,
+            min_value=0.0,
+            max_value=1.0,
+            description="Segment length",
+        ),
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         start = int(len(frame) * params["start"])
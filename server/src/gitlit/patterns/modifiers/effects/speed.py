@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 import numpy as np
 
@@ -8,20 +8,17 @@ from ..base import BaseModifier, ModifierSpec
 class SpeedModifier(BaseModifier):
     """Modify pattern speed"""
 
-    @classmethod
-    @property
-    def parameters(cls) -> List[ModifierSpec]:
-        return [
-            ModifierSpec(
-                name="speed",
-                type=float,
-                default=1.0,
-                min_value=0.1,
-                max_value=10.0,
-                description="Speed multiplier",
-                units="x",
-            )
-        ]
+    parameters = [
+        ModifierSpec(
+            name="speed",
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=10.0,
+            description="Speed multiplier",
+            units="x",
+        )
+    ]
 
     def _apply(self, frame: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         # Speed is handled by pattern timing system
@@ -21,6 +21,13 @@ class Transition:
         self.progress = min(1.0, self.progress + (delta_ms / self.duration_ms))
         return self.progress >= 1.0
 
+    def apply(
+        self, from_frame: np.ndarray, to_frame: np.ndarray, progress: float
+    ) -> np.ndarray:
+        """Blend between two frames at the given progress"""
+        self.progress = progress
+        return self.blend(from_frame, to_frame)
+
     def blend(self, from_frame: np.ndarray, to_frame: np.ndarray) -> np.ndarray:
         """Blend between two frames based on transition progress"""
         raise NotImplementedError
@@ -29,9 +36,32 @@ class Transition:
 class CrossFadeTransition(Transition):
     """Smooth crossfade between patterns"""
 
+    def __init__(self, duration_ms: float = 500.0):
+        super().__init__(duration_ms)
+        self._from_weighted = np.empty(0, dtype=np.uint16)
+        self._to_weighted = np.empty(0, dtype=np.uint16)
+        self._frame = np.empty(0, dtype=np.uint8)
+
     def blend(self, from_frame: np.ndarray, to_frame: np.ndarray) -> np.ndarray:
-        """Linear interpolation between frames"""
-        return from_frame * (1 - self.progress) + to_frame * self.progress
+        """Linear interpolation between uint8 frames in Q8 fixed point
+
+        Returns a buffer owned by the transition, overwritten on the next blend.
+        """
+        if self._frame.shape != to_frame.shape:
+            self._from_weighted = np.empty(to_frame.shape, dtype=np.uint16)
+            self._to_weighted = np.empty(to_frame.shape, dtype=np.uint16)
+            self._frame = np.empty(to_frame.shape, dtype=np.uint8)
+
+        # from * (256 - w) + to * w peaks at 255 * 256, so it fits in uint16
+        weight = int(self.progress * 256 + 0.5)
+        # Widen before scaling so the products never depend on type promotion
+        np.copyto(self._from_weighted, from_frame)
+        np.copyto(self._to_weighted, to_frame)
+        self._from_weighted *= np.uint16(256 - weight)
+        self._to_weighted *= np.uint16(weight)
+        self._from_weighted += self._to_weighted
+        np.right_shift(self._from_weighted, 8, out=self._frame, casting="unsafe")
+        return self._frame
 
 
 class InstantTransition(Transition):
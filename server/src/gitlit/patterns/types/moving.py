@@ -1,5 +1,5 @@
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 import numpy as np
 
@@ -10,8 +10,73 @@ from ..base import BasePattern, ColorSpec, ModifiableAttribute, Parameter
 class WavePattern(BasePattern):
     """Sinusoidal wave pattern"""
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
+    parameters = [
+        Parameter(
+            name="speed",
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=5.0,
+            description="Wave movement speed",
+            units="Hz",
+        ),
+        Parameter(
+            name="wavelength",
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=5.0,
+            description="Length of one complete wave",
+            units="strips",
+        ),
+        ColorSpec(name="red", description="Red component of wave color"),
+        ColorSpec(name="green", description="Green component of wave color"),
+        ColorSpec(name="blue", description="Blue component of wave color"),
+    ]
+
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="timing",
+            description="Wave timing properties",
+            parameter_specs=[
+                Parameter(
+                    name="speed_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Speed multiplier",
+                ),
+                Parameter(
+                    name="phase",
+                    type=float,
+                    default=0.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Wave phase offset",
+                ),
+            ],
+            supports_audio=True,  # Can sync to beat/BPM
+        ),
+        ModifiableAttribute(
+            name="amplitude",
+            description="Wave amplitude properties",
+            parameter_specs=[
+                Parameter(
+                    name="amplitude_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=2.0,
+                    description="Wave height multiplier",
+                )
+            ],
+            supports_audio=True,  # Can react to volume
+        ),
+    ]
+
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
         self.state.cached_data.update(
             {
                 "last_wavelength": 1.0,
@@ -35,81 +100,9 @@ class WavePattern(BasePattern):
         self.state.cache_value("last_speed", speed)
         self.state.cache_value("last_color", color)
 
-        # Generate wave using cached values
-        for i in range(self.led_count):
-            phase = (i / self.led_count) * wavelength * 2 * math.pi
-            brightness = (math.sin(phase + t * 2 * math.pi) + 1) / 2
-            self.frame_buffer[i] = [int(c * brightness) for c in color]
+        # Generate wave across all LEDs at once
+        phase = (self._led_index / self.led_count) * wavelength * 2 * math.pi
+        brightness = (np.sin(phase + t * 2 * math.pi) + 1) / 2
+        self.frame_planes[:] = np.array(color, dtype=np.float64)[:, None] * brightness
 
         return self.frame_buffer
-
-    @classmethod
-    @property
-    def parameters(cls) -> List[Parameter]:
-        return [
-            Parameter(
-                name="speed",
-                type=float,
-                default=1.0,
-                min_value=0.1,
-                max_value=5.0,
-                description="Wave movement speed",
-                units="Hz",
-            ),
-            Parameter(
-                name="wavelength",
-                type=float,
-                default=1.0,
-                min_value=0.1,
-                max_value=5.0,
-                description="Length of one complete wave",
-                units="strips",
-            ),
-            ColorSpec(name="red", description="Red component of wave color"),
-            ColorSpec(name="green", description="Green component of wave color"),
-            ColorSpec(name="blue", description="Blue component of wave color"),
-        ]
-
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="timing",
-                description="Wave timing properties",
-                parameter_specs=[
-                    Parameter(
-                        name="speed_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Speed multiplier",
-                    ),
-                    Parameter(
-                        name="phase",
-                        type=float,
-                        default=0.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Wave phase offset",
-                    ),
-                ],
-                supports_audio=True,  # Can sync to beat/BPM
-            ),
-            ModifiableAttribute(
-                name="amplitude",
-                description="Wave amplitude properties",
-                parameter_specs=[
-                    Parameter(
-                        name="amplitude_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=2.0,
-                        description="Wave height multiplier",
-                    )
-                ],
-                supports_audio=True,  # Can react to volume
-            ),
-        ]
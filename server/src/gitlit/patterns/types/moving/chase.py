@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -58,6 +58,23 @@ class ChasePattern(BasePattern):
         ),
     ]
 
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        self._dot_key = None
+        self._dot_offsets = np.empty(0, dtype=np.int64)
+        self._dot_fade = np.empty(0, dtype=np.float64)
+
+    def _get_dot_ramp(self, size: int, fade: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get lit pixel offsets and brightness of one dot, rebuilt on change"""
+        if (size, fade) != self._dot_key:
+            offsets = np.arange(-size, size + 1)
+            brightness = 1.0 - (np.abs(offsets) / size) * fade
+            lit = brightness > 0
+            self._dot_offsets = offsets[lit]
+            self._dot_fade = brightness[lit]
+            self._dot_key = (size, fade)
+        return self._dot_offsets, self._dot_fade
+
     async def _generate(self, time_ms: float) -> np.ndarray:
         """Generate chase pattern frame"""
         # Get parameters from state
@@ -75,21 +92,16 @@ class ChasePattern(BasePattern):
 
         # Calculate positions
         t = (time_ms / 1000.0) * speed
-        positions = [(i / count + t) % 1.0 for i in range(count)]
+        positions = (np.arange(count) / count + t) % 1.0
+        centers = (positions * self.num_leds).astype(np.int64)
 
         # Initialize frame buffer
         self.frame_buffer.fill(0)
 
-        # Draw chase dots
-        for pos in positions:
-            # Calculate LED indices affected by this dot
-            center_idx = int(pos * self.num_leds)
-            for i in range(-size, size + 1):
-                idx = (center_idx + i) % self.num_leds
-                # Calculate fade based on distance from center
-                dist = abs(i) / size
-                brightness = 1.0 - (dist * fade)
-                if brightness > 0:
-                    self.frame_buffer[idx] = (color * brightness).astype(np.uint8)
+        # Draw all chase dots at once, later dots win where they overlap
+        offsets, brightness = self._get_dot_ramp(size, fade)
+        indices = (centers[:, None] + offsets) % self.num_leds
+        dot = (color[:, None] * brightness).astype(np.uint8)
+        self.frame_planes[:, indices] = dot[:, None, :]
 
         return self.frame_buffer
@@ -1,9 +1,11 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 import numpy as np
-import colorsys
 
 from ...base import BasePattern, ModifiableAttribute, Parameter
 
+# Per-channel sector offsets for the branchless HSV to RGB formula
+_HSV_CHANNEL_OFFSETS = np.array([5.0, 3.0, 1.0])[:, None]
+
 
 class RainbowPattern(BasePattern):
     """Moving rainbow pattern across the strip with enhanced color control"""
@@ -70,60 +72,57 @@ class RainbowPattern(BasePattern):
         ),
     ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="color",
-                description="Rainbow color properties",
-                parameter_specs=[
-                    Parameter(
-                        name="saturation_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=2.0,
-                        description="Saturation multiplier",
-                    ),
-                    Parameter(
-                        name="value_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=2.0,
-                        description="Brightness multiplier",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-            ModifiableAttribute(
-                name="motion",
-                description="Rainbow motion properties",
-                parameter_specs=[
-                    Parameter(
-                        name="speed_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Speed multiplier",
-                    ),
-                    Parameter(
-                        name="wave_amplitude",
-                        type=float,
-                        default=0.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Wave motion amplitude",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-        ]
-
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="color",
+            description="Rainbow color properties",
+            parameter_specs=[
+                Parameter(
+                    name="saturation_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=2.0,
+                    description="Saturation multiplier",
+                ),
+                Parameter(
+                    name="value_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=2.0,
+                    description="Brightness multiplier",
+                ),
+            ],
+            supports_audio=True,
+        ),
+        ModifiableAttribute(
+            name="motion",
+            description="Rainbow motion properties",
+            parameter_specs=[
+                Parameter(
+                    name="speed_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Speed multiplier",
+                ),
+                Parameter(
+                    name="wave_amplitude",
+                    type=float,
+                    default=0.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Wave motion amplitude",
+                ),
+            ],
+            supports_audio=True,
+        ),
+    ]
+
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
         self.state.cached_data.update(
             {
                 "last_speed": 1.0,
@@ -138,13 +137,13 @@ class RainbowPattern(BasePattern):
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate rainbow pattern with enhanced control"""
         # Get parameters with validation
-        speed = np.clip(params.get("speed", 1.0), 0.1, 5.0)
-        scale = np.clip(params.get("scale", 1.0), 0.1, 5.0)
-        saturation = np.clip(params.get("saturation", 1.0), 0.0, 1.0)
-        value = np.clip(params.get("value", 1.0), 0.0, 1.0)
-        offset = np.clip(params.get("offset", 0.0), 0.0, 1.0)
+        speed = max(0.1, min(5.0, params.get("speed", 1.0)))
+        scale = max(0.1, min(5.0, params.get("scale", 1.0)))
+        saturation = max(0.0, min(1.0, params.get("saturation", 1.0)))
+        value = max(0.0, min(1.0, params.get("value", 1.0)))
+        offset = max(0.0, min(1.0, params.get("offset", 0.0)))
         reverse = params.get("reverse", False)
-        wave_amplitude = np.clip(params.get("wave_amplitude", 0.0), 0.0, 1.0)
+        wave_amplitude = max(0.0, min(1.0, params.get("wave_amplitude", 0.0)))
 
         # Cache current values for transitions
         self.state.cache_value("last_speed", speed)
@@ -157,50 +156,32 @@ class RainbowPattern(BasePattern):
         # Use timing system for smooth movement
         t = self.timing.get_phase() * (-1 if reverse else 1)
 
-        # Generate rainbow colors
-        for i in range(self.led_count):
-            # Calculate hue position with wave motion
-            base_pos = i / self.led_count
-            wave_offset = np.sin(base_pos * 2 * np.pi) * wave_amplitude
-            hue = ((base_pos + wave_offset) * scale + t + offset) % 1.0
-
-            # Convert HSV to RGB
-            rgb = colorsys.hsv_to_rgb(hue, saturation, value)
+        # Calculate hue per LED with wave motion
+        base_pos = self._led_index / self.led_count
+        wave_offset = np.sin(base_pos * 2 * np.pi) * wave_amplitude
+        hue = ((base_pos + wave_offset) * scale + t + offset) % 1.0
 
-            # Scale to 0-255 range
-            self.frame_buffer[i] = (np.array(rgb) * 255).astype(np.uint8)
+        self._hsv_to_rgb_vectorized(hue, saturation, value)
 
         return self.frame_buffer
 
-    def _hsv_to_rgb_vectorized(self, hsv: np.ndarray) -> np.ndarray:
-        """Convert HSV colors to RGB efficiently"""
-        h, s, v = hsv[:, 0], hsv[:, 1], hsv[:, 2]
-
-        h = (h * 6.0) % 6.0
-        i = h.astype(np.int32)
-        f = h - i
-
-        p = v * (1.0 - s)
-        q = v * (1.0 - s * f)
-        t = v * (1.0 - s * (1.0 - f))
-
-        i = i.reshape(-1, 1) % 6
-        v = v.reshape(-1, 1)
-        p = p.reshape(-1, 1)
-        q = q.reshape(-1, 1)
-        t = t.reshape(-1, 1)
-
-        mask = np.zeros((len(h), 3))
-        mask[i == 0] = [1, 0, 0]
-        mask[i == 1] = [0, 1, 0]
-        mask[i == 2] = [0, 0, 1]
-        mask[i == 3] = [0, 0, 1]
-        mask[i == 4] = [0, 1, 0]
-        mask[i == 5] = [1, 0, 0]
-
-        rgb = np.where(mask == 1, v, np.where(mask == 0, p, np.where(i % 2 == 0, t, q)))
-
-        return (rgb * 255).astype(np.uint8)
+    def _hsv_to_rgb_vectorized(
+        self, hue: np.ndarray, saturation: float, value: float
+    ) -> None:
+        """Convert per-LED hues to RGB directly into the frame planes
+
+        Each channel is v * (1 - s * clip(min(k, 4 - k), 0, 1)) with
+        k = (6h + n) % 6, so all three planes come from one (3, N) array
+        expression without selecting per hue sector.
+        """
+        k = hue * 6.0 + _HSV_CHANNEL_OFFSETS
+        k %= 6.0
+        np.minimum(k, 4.0 - k, out=k)
+        np.clip(k, 0.0, 1.0, out=k)
+        k *= -saturation
+        k += 1.0
+        k *= value * 255.0
+        np.copyto(self.frame_planes, k, casting="unsafe")
 
     def _hsv_to_rgb(self, h: float, s: float, v: float, index: int) -> None:
         if s == 0.0:
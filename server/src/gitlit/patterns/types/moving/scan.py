@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -54,6 +54,24 @@ class ScanPattern(BasePattern):
         ),
     ]
 
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        self._bar_key = None
+        self._bar_offsets = np.empty(0, dtype=np.int64)
+        self._bar_fade = np.empty(0, dtype=np.float64)
+
+    def _get_bar_ramp(self, width: int, fade: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get pixel offsets and intensity across the bar, rebuilt on change"""
+        if (width, fade) != self._bar_key:
+            self._bar_offsets = np.arange(-width, width + 1)
+            if fade > 0:
+                distance = np.abs(self._bar_offsets) / width
+                self._bar_fade = 1.0 - distance ** (1.0 / fade)
+            else:
+                self._bar_fade = np.ones(len(self._bar_offsets))
+            self._bar_key = (width, fade)
+        return self._bar_offsets, self._bar_fade
+
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         width = params.get("width", 3)
         fade = params.get("fade", 0.3)
@@ -75,10 +93,11 @@ class ScanPattern(BasePattern):
         # Clear buffer
         self.frame_buffer.fill(0)
 
-        # Draw scan bar with fade
-        for i in range(max(0, center - width), min(self.led_count, center + width + 1)):
-            distance = abs(i - center)
-            intensity = 1.0 - (distance / width) ** (1.0 / fade) if fade > 0 else 1.0
-            self.frame_buffer[i] = (color * intensity).astype(np.uint8)
+        # Draw the on-strip part of the scan bar with fade
+        offsets, intensity = self._get_bar_ramp(width, fade)
+        pixels = center + offsets
+        visible = (pixels >= 0) & (pixels < self.led_count)
+        bar = (color[:, None] * intensity[visible]).astype(np.uint8)
+        self.frame_planes[:, pixels[visible]] = bar
 
         return self.frame_buffer
@@ -1,5 +1,5 @@
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -45,8 +45,8 @@ class WavePattern(BasePattern):
         ),
     ]
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
         self.state.cached_data.update(
             {
                 "last_wavelength": 1.0,
@@ -55,6 +55,18 @@ class WavePattern(BasePattern):
                 "last_phase": 0.0,
             }
         )
+        self._table_key = None
+        self._sin_table = np.empty(0, dtype=np.float32)
+        self._cos_table = np.empty(0, dtype=np.float32)
+
+    def _get_wave_tables(self, wavelength: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get per-LED sin/cos of the spatial phase, rebuilt on change"""
+        if wavelength != self._table_key:
+            phase = self._led_index / self.led_count * wavelength * 2 * math.pi
+            self._sin_table = np.sin(phase).astype(np.float32)
+            self._cos_table = np.cos(phase).astype(np.float32)
+            self._table_key = wavelength
+        return self._sin_table, self._cos_table
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         wavelength = params.get("wavelength", 1.0)
@@ -67,9 +79,13 @@ class WavePattern(BasePattern):
         # Use timing system directly for consistent period
         t = self.timing.get_phase()  # Already handles speed scaling
 
-        for i in range(self.led_count):
-            phase = (i / self.led_count) * wavelength * 2 * math.pi
-            brightness = ((math.sin(phase + t * 2 * math.pi) + 1) / 2) * amplitude
-            self.frame_buffer[i] = (color * brightness).astype(np.uint8)
+        # sin(phase + theta) by angle addition, so only theta needs evaluating
+        sin_table, cos_table = self._get_wave_tables(wavelength)
+        theta = t * 2 * math.pi
+        brightness = sin_table * math.cos(theta) + cos_table * math.sin(theta)
+        brightness += 1
+        brightness *= amplitude / 2
+        scaled = self._scale_color(color, brightness)
+        np.copyto(self.frame_planes, scaled, casting="unsafe")
 
         return self.frame_buffer
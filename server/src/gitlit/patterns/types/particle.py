@@ -1,6 +1,5 @@
 import math
-import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import numpy as np
 
@@ -12,112 +11,128 @@ from ..base import BasePattern, ColorSpec, ModifiableAttribute, Parameter
 class TwinklePattern(BasePattern):
     """Random twinkling lights that fade in and out"""
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
-        self.state.cached_data[
-            "active_twinkles"
-        ] = {}  # {position: (brightness, color)}
-        self.state.cached_data["last_density"] = 0.1
-        self.state.cached_data["last_fade_speed"] = 1.0
+    parameters = [
+        Parameter(
+            name="density",
+            type=float,
+            default=0.1,
+            min_value=0.01,
+            max_value=0.5,
+            description="Probability of new twinkle per frame",
+        ),
+        Parameter(
+            name="fade_speed",
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=5.0,
+            description="Speed of fade in/out",
+            units="Hz",
+        ),
+        ColorSpec(name="red", description="Red component of twinkle color"),
+        ColorSpec(name="green", description="Green component of twinkle color"),
+        ColorSpec(name="blue", description="Blue component of twinkle color"),
+        Parameter(
+            name="random_color",
+            type=bool,
+            default=False,
+            description="Randomize colors of each twinkle",
+        ),
+    ]
 
-    @classmethod
-    @property
-    def parameters(cls) -> List[Parameter]:
-        return [
-            Parameter(
-                name="density",
-                type=float,
-                default=0.1,
-                min_value=0.01,
-                max_value=0.5,
-                description="Probability of new twinkle per frame",
-            ),
-            Parameter(
-                name="fade_speed",
-                type=float,
-                default=1.0,
-                min_value=0.1,
-                max_value=5.0,
-                description="Speed of fade in/out",
-                units="Hz",
-            ),
-            ColorSpec(name="red", description="Red component of twinkle color"),
-            ColorSpec(name="green", description="Green component of twinkle color"),
-            ColorSpec(name="blue", description="Blue component of twinkle color"),
-            Parameter(
-                name="random_color",
-                type=bool,
-                default=False,
-                description="Randomize colors of each twinkle",
-            ),
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="spawn",
+            description="Twinkle spawning properties",
+            parameter_specs=[
+                Parameter(
+                    name="density_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Spawn rate multiplier",
+                )
+            ],
+            supports_audio=True,  # Can sync to beat/volume
+        ),
+        ModifiableAttribute(
+            name="lifetime",
+            description="Twinkle lifetime properties",
+            parameter_specs=[
+                Parameter(
+                    name="fade_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Fade speed multiplier",
+                )
+            ],
+            supports_audio=True,  # Can react to audio features
+        ),
+    ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="spawn",
-                description="Twinkle spawning properties",
-                parameter_specs=[
-                    Parameter(
-                        name="density_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Spawn rate multiplier",
-                    )
-                ],
-                supports_audio=True,  # Can sync to beat/volume
-            ),
-            ModifiableAttribute(
-                name="lifetime",
-                description="Twinkle lifetime properties",
-                parameter_specs=[
-                    Parameter(
-                        name="fade_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Fade speed multiplier",
-                    )
-                ],
-                supports_audio=True,  # Can react to audio features
-            ),
-        ]
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        # Active twinkles as parallel arrays, first `_tw_n` entries are live
+        self._tw_pos = np.empty(led_count, dtype=np.int32)
+        self._tw_bri = np.empty(led_count, dtype=np.float32)
+        self._tw_col = np.empty((3, led_count), dtype=np.uint8)
+        self._tw_n = 0
+        self._rng = np.random.default_rng()
+        self.state.cached_data["last_density"] = 0.1
+        self.state.cached_data["last_fade_speed"] = 1.0
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate twinkling lights pattern"""
-        active_twinkles = self.state.cached_data["active_twinkles"]
         density = params.get("density", 0.1)
         fade_speed = params.get("fade_speed", 1.0)
+        dt = self.state.delta_time
 
         # Cache parameters for transitions
         self.state.cache_value("last_density", density)
         self.state.cache_value("last_fade_speed", fade_speed)
 
         # Use state's delta_time for timing
-        if (
-            random.random() < density * self.state.delta_time * 30
-        ):  # Normalized to ~30fps
-            pos = random.randint(0, self.led_count - 1)
-            color = self._get_color(params)
-            active_twinkles[pos] = (1.0, color)
-
-        # Update using delta_time
-        to_remove = []
-        for pos, (brightness, color) in active_twinkles.items():
-            brightness -= fade_speed * self.state.delta_time
-            if brightness <= 0:
-                to_remove.append(pos)
+        if self._rng.random() < density * dt * 30:  # Normalized to ~30fps
+            pos = self._rng.integers(self.led_count)
+            if params.get("random_color", False):
+                color = self._rng.integers(0, 256, size=3, dtype=np.uint8)
             else:
-                active_twinkles[pos] = (brightness, color)
-                self.frame_buffer[pos] = [int(c * brightness) for c in color]
+                color = [
+                    params.get("red", 255),
+                    params.get("green", 255),
+                    params.get("blue", 255),
+                ]
+
+            # Restart an existing twinkle at this position, else append
+            n = self._tw_n
+            existing = np.flatnonzero(self._tw_pos[:n] == pos)
+            slot = int(existing[0]) if existing.size else n
+            self._tw_pos[slot] = pos
+            self._tw_bri[slot] = 1.0
+            self._tw_col[:, slot] = color
+            if slot == n:
+                self._tw_n = n + 1
+
+        # Fade and draw all twinkles at once, expired ones draw black
+        n = self._tw_n
+        if n:
+            brightness = self._tw_bri[:n]
+            brightness -= fade_speed * dt
+            np.maximum(brightness, 0.0, out=brightness)
+            scaled = self._scale_color(self._tw_col[:, :n], brightness)
+            self.frame_planes[:, self._tw_pos[:n]] = scaled
 
-        for pos in to_remove:
-            del active_twinkles[pos]
+            # Compact out the expired twinkles
+            keep = brightness > 0
+            if not keep.all():
+                live = int(np.count_nonzero(keep))
+                self._tw_pos[:live] = self._tw_pos[:n][keep]
+                self._tw_bri[:live] = brightness[keep]
+                self._tw_col[:, :live] = self._tw_col[:, :n][:, keep]
+                self._tw_n = live
 
         return self.frame_buffer
 
@@ -125,104 +140,102 @@ class TwinklePattern(BasePattern):
 class MeteorPattern(BasePattern):
     """Falling meteor effect with trails"""
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
-        self.state.cached_data["meteors"] = []  # [(position, velocity, color)]
+    parameters = [
+        Parameter(
+            name="speed",
+            type=float,
+            default=1.0,
+            min_value=0.1,
+            max_value=5.0,
+            description="Fall speed",
+            units="Hz",
+        ),
+        Parameter(
+            name="size",
+            type=int,
+            default=3,
+            min_value=1,
+            max_value=10,
+            description="Meteor size",
+        ),
+        Parameter(
+            name="trail_length",
+            type=float,
+            default=0.5,
+            min_value=0.0,
+            max_value=1.0,
+            description="Length of meteor trail",
+        ),
+        Parameter(
+            name="spawn_rate",
+            type=float,
+            default=0.5,
+            min_value=0.1,
+            max_value=2.0,
+            description="New meteor frequency",
+            units="Hz",
+        ),
+        ColorSpec(name="red", description="Red component of meteor color"),
+        ColorSpec(name="green", description="Green component of meteor color"),
+        ColorSpec(name="blue", description="Blue component of meteor color"),
+        Parameter(
+            name="random_color",
+            type=bool,
+            default=False,
+            description="Randomize meteor colors",
+        ),
+    ]
 
-    @classmethod
-    @property
-    def parameters(cls) -> List[Parameter]:
-        return [
-            Parameter(
-                name="speed",
-                type=float,
-                default=1.0,
-                min_value=0.1,
-                max_value=5.0,
-                description="Fall speed",
-                units="Hz",
-            ),
-            Parameter(
-                name="size",
-                type=int,
-                default=3,
-                min_value=1,
-                max_value=10,
-                description="Meteor size",
-            ),
-            Parameter(
-                name="trail_length",
-                type=float,
-                default=0.5,
-                min_value=0.0,
-                max_value=1.0,
-                description="Length of meteor trail",
-            ),
-            Parameter(
-                name="spawn_rate",
-                type=float,
-                default=0.5,
-                min_value=0.1,
-                max_value=2.0,
-                description="New meteor frequency",
-                units="Hz",
-            ),
-            ColorSpec(name="red", description="Red component of meteor color"),
-            ColorSpec(name="green", description="Green component of meteor color"),
-            ColorSpec(name="blue", description="Blue component of meteor color"),
-            Parameter(
-                name="random_color",
-                type=bool,
-                default=False,
-                description="Randomize meteor colors",
-            ),
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="movement",
+            description="Meteor movement properties",
+            parameter_specs=[
+                Parameter(
+                    name="speed_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Speed multiplier",
+                ),
+                Parameter(
+                    name="direction",
+                    type=bool,
+                    default=True,
+                    description="Fall direction",
+                ),
+            ],
+            supports_audio=True,  # Can sync to beat/onset
+        ),
+        ModifiableAttribute(
+            name="spawning",
+            description="Meteor spawning properties",
+            parameter_specs=[
+                Parameter(
+                    name="spawn_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Spawn rate multiplier",
+                )
+            ],
+            supports_audio=True,  # Can react to volume/onset
+        ),
+    ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="movement",
-                description="Meteor movement properties",
-                parameter_specs=[
-                    Parameter(
-                        name="speed_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Speed multiplier",
-                    ),
-                    Parameter(
-                        name="direction",
-                        type=bool,
-                        default=True,
-                        description="Fall direction",
-                    ),
-                ],
-                supports_audio=True,  # Can sync to beat/onset
-            ),
-            ModifiableAttribute(
-                name="spawning",
-                description="Meteor spawning properties",
-                parameter_specs=[
-                    Parameter(
-                        name="spawn_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Spawn rate multiplier",
-                    )
-                ],
-                supports_audio=True,  # Can react to volume/onset
-            ),
-        ]
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        # Active meteors as parallel arrays, first `_m_n` entries are live
+        self._m_pos = np.empty(led_count, dtype=np.float32)
+        self._m_vel = np.empty(led_count, dtype=np.float32)
+        self._m_col = np.empty((3, led_count), dtype=np.uint8)
+        self._m_n = 0
+        self._rng = np.random.default_rng()
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate falling meteors pattern"""
-        meteors = self.state.cached_data["meteors"]
         speed = params.get("speed", 1.0)
         size = params.get("size", 3)
         trail_length = params.get("trail_length", 0.5)
@@ -233,45 +246,50 @@ class MeteorPattern(BasePattern):
             params.get("green", 255),
             params.get("blue", 255),
         ]
+        dt = self.state.delta_time
 
         # Clear buffer
         self.frame_buffer.fill(0)
 
         # Spawn new meteors using delta_time for consistent rate
+        n = self._m_n
         if (
-            random.random() < spawn_rate * self.state.delta_time * 30
+            self._rng.random() < spawn_rate * dt * 30 and n < self.led_count
         ):  # Normalized to ~30fps
-            color = (
-                [random.randint(0, 255) for _ in range(3)]
+            self._m_pos[n] = 0  # Start at top
+            self._m_vel[n] = speed
+            self._m_col[:, n] = (
+                self._rng.integers(0, 256, size=3, dtype=np.uint8)
                 if random_color
                 else base_color
             )
-            meteors.append((0, speed, color))  # Start at top
-
-        # Update meteor positions using delta_time
-        new_meteors = []
-        for pos, vel, color in meteors:
-            new_pos = pos + vel * self.state.delta_time * 30
-            if new_pos < self.led_count:
-                new_meteors.append((new_pos, vel, color))
+            n = self._m_n = n + 1
 
-                # Draw meteor and trail
-                for i in range(size + int(size * trail_length)):
-                    pixel_pos = int(new_pos - i)
-                    if 0 <= pixel_pos < self.led_count:
-                        # Calculate fade based on trail position
-                        if i < size:
-                            intensity = 1.0  # Full brightness for meteor head
-                        else:
-                            # Fade trail
-                            trail_pos = i - size
-                            intensity = 1.0 - (trail_pos / (size * trail_length))
+        # Advance all meteors at once and drop those past the end of the strip
+        self._m_pos[:n] += self._m_vel[:n] * (dt * 30)
+        keep = self._m_pos[:n] < self.led_count
+        if not keep.all():
+            live = int(np.count_nonzero(keep))
+            self._m_pos[:live] = self._m_pos[:n][keep]
+            self._m_vel[:live] = self._m_vel[:n][keep]
+            self._m_col[:, :live] = self._m_col[:, :n][:, keep]
+            n = self._m_n = live
+        if not n:
+            return self.frame_buffer
 
-                        self.frame_buffer[pixel_pos] = [
-                            int(c * intensity) for c in color
-                        ]
+        # Full brightness head followed by a linearly fading trail
+        trail_pixels = int(size * trail_length)
+        intensity = np.ones(size + trail_pixels, dtype=np.float32)
+        if trail_pixels:
+            intensity[size:] -= np.arange(trail_pixels) / (size * trail_length)
 
-        # Update meteor list
-        self.state.cached_data["meteors"] = new_meteors
+        # Rasterize every meteor, brightest contribution wins on overlap
+        offsets = np.arange(intensity.shape[0])
+        pixels = (self._m_pos[:n, None] - offsets).astype(np.int32)
+        meteor_idx, offset_idx = np.nonzero((pixels >= 0) & (pixels < self.led_count))
+        values = (self._m_col[:, meteor_idx] * intensity[offset_idx]).astype(np.uint8)
+        pixel_idx = pixels[meteor_idx, offset_idx]
+        for channel in range(3):
+            np.maximum.at(self.frame_planes[channel], pixel_idx, values[channel])
 
         return self.frame_buffer
@@ -1,5 +1,7 @@
 """Breathing light pattern implementation."""
 
+import math
+
 import numpy as np
 from typing import List
 
@@ -58,11 +60,10 @@ class BreathePattern(BasePattern):
 
         # Calculate brightness using sine wave
         t = (time_ms / 1000.0) * speed
-        brightness = (np.sin(t * 2 * np.pi) + 1) / 2  # 0 to 1
+        brightness = (math.sin(t * 2 * math.pi) + 1) / 2  # 0 to 1
         brightness = min_bright + (max_bright - min_bright) * brightness
 
-        # Apply brightness to color
-        self.frame_buffer.fill(0)
-        self.frame_buffer[:] = (color * brightness).astype(np.uint8)
+        # Apply brightness to color, filling each contiguous channel plane
+        self.frame_planes[:] = (color * brightness).astype(np.uint8)[:, None]
 
         return self.frame_buffer
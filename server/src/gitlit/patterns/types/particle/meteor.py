@@ -1,5 +1,4 @@
-import random
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Tuple, Optional
 import numpy as np
 
 from ...base import BasePattern, ColorSpec, ModifiableAttribute, Parameter
@@ -50,74 +49,83 @@ class MeteorPattern(BasePattern):
         ),
     ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="spawn",
-                description="Meteor spawning properties",
-                parameter_specs=[
-                    Parameter(
-                        name="rate_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Spawn rate multiplier",
-                    ),
-                    Parameter(
-                        name="size_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Size multiplier",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-            ModifiableAttribute(
-                name="motion",
-                description="Meteor motion properties",
-                parameter_specs=[
-                    Parameter(
-                        name="speed_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.1,
-                        max_value=5.0,
-                        description="Speed multiplier",
-                    ),
-                    Parameter(
-                        name="gravity_scale",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=5.0,
-                        description="Gravity multiplier",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="spawn",
+            description="Meteor spawning properties",
+            parameter_specs=[
+                Parameter(
+                    name="rate_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Spawn rate multiplier",
+                ),
+                Parameter(
+                    name="size_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Size multiplier",
+                ),
+            ],
+            supports_audio=True,
+        ),
+        ModifiableAttribute(
+            name="motion",
+            description="Meteor motion properties",
+            parameter_specs=[
+                Parameter(
+                    name="speed_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.1,
+                    max_value=5.0,
+                    description="Speed multiplier",
+                ),
+                Parameter(
+                    name="gravity_scale",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=5.0,
+                    description="Gravity multiplier",
+                ),
+            ],
+            supports_audio=True,
+        ),
+    ]
+
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        self._rng = np.random.default_rng()
+        self._trail_key = None
+        self._trail_offsets = np.empty(0, dtype=np.int32)
+        self._trail_fade = np.empty(0, dtype=np.float32)
 
     def _get_meteor_color(self, params: Dict[str, Any]) -> np.ndarray:
         """Get meteor color, either from parameters or random"""
         if params.get("random_color", False):
-            return np.array(
-                [
-                    random.randint(0, 255),
-                    random.randint(0, 255),
-                    random.randint(0, 255),
-                ],
-                dtype=np.uint8,
-            )
+            return self._rng.integers(0, 256, size=3, dtype=np.uint8)
         return np.array(
             [params.get("red", 255), params.get("green", 255), params.get("blue", 255)],
             dtype=np.uint8,
         )
 
+    def _get_trail_ramp(
+        self, trail_pixels: int, decay: float = 1.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get trail offsets and decayed linear fade, rebuilt only on change"""
+        if (trail_pixels, decay) != self._trail_key:
+            self._trail_offsets = np.arange(trail_pixels, dtype=np.int32)
+            self._trail_fade = (
+                1.0 - self._trail_offsets.astype(np.float32) / trail_pixels
+            ) * np.float32(decay)
+            self._trail_key = (trail_pixels, decay)
+        return self._trail_offsets, self._trail_fade
+
     def _draw_meteor(
         self,
         pos: float,
@@ -133,16 +141,17 @@ class MeteorPattern(BasePattern):
             return
 
         # Draw meteor head
-        for i in range(max(0, head_pos - size + 1), min(self.led_count, head_pos + 1)):
-            self.frame_buffer[i] = color
+        self.frame_buffer[max(0, head_pos - size + 1) : head_pos + 1] = color
 
         # Draw trail
         trail_pixels = int(trail_length * self.led_count)
-        for i in range(trail_pixels):
-            trail_pos = head_pos - (i + size) * direction
-            if 0 <= trail_pos < self.led_count:
-                fade = 1.0 - (i / trail_pixels)
-                self.frame_buffer[trail_pos] = (color * fade).astype(np.uint8)
+        if trail_pixels:
+            offsets, fade = self._get_trail_ramp(trail_pixels)
+            trail_pos = head_pos - (offsets + size) * direction
+            visible = (trail_pos >= 0) & (trail_pos < self.led_count)
+            self.frame_planes[:, trail_pos[visible]] = self._scale_color(
+                color, fade[visible]
+            )
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate meteor pattern with physics"""
@@ -165,18 +174,15 @@ class MeteorPattern(BasePattern):
         pos = int(t * self.led_count)
 
         # Draw meteor head
-        for i in range(size):
-            idx = (pos + i) % self.led_count
-            self.frame_buffer[idx] = self._get_meteor_color(params)
+        color = self._get_meteor_color(params)
+        head = (pos + self._led_index[:size]) % self.led_count
+        self.frame_planes[:, head] = color[:, None]
 
         # Draw trail
         trail_size = int(self.led_count * trail_length)
-        for i in range(trail_size):
-            idx = (pos - i) % self.led_count
-            fade = (1.0 - (i / trail_size)) * decay
-            if fade > 0:
-                self.frame_buffer[idx] = (self._get_meteor_color(params) * fade).astype(
-                    np.uint8
-                )
+        if trail_size and decay > 0:
+            offsets, fade = self._get_trail_ramp(trail_size, decay)
+            trail = self._scale_color(color, fade)
+            self.frame_planes[:, (pos - offsets) % self.led_count] = trail
 
         return self.frame_buffer
@@ -1,5 +1,4 @@
-import random
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -51,11 +50,12 @@ class TwinklePattern(BasePattern):
         ),
     ]
 
-    def __init__(self, led_count: int):
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
         """Initialize twinkle pattern"""
-        super().__init__(led_count)
+        super().__init__(led_count, frame_buffer)
+        self._rng = np.random.default_rng()
         self.twinkles = np.zeros(led_count, dtype=np.float32)
-        self.phases = np.random.random(led_count)
+        self.phases = self._rng.random(led_count)
         self.state.cached_data["last_density"] = 0.1
         self.state.cached_data["last_fade_speed"] = 1.0
 
@@ -78,7 +78,7 @@ class TwinklePattern(BasePattern):
         self.phases = (self.phases + 0.1) % 1.0
 
         # Randomly add new twinkles
-        mask = np.random.random(self.led_count) < density
+        mask = self._rng.random(self.led_count) < density
         self.twinkles[mask] = 1.0
 
         # Calculate brightness
@@ -87,7 +87,8 @@ class TwinklePattern(BasePattern):
         brightness *= self.twinkles
 
         # Apply brightness to color
-        self.frame_buffer = (color[None, :] * brightness[:, None]).astype(np.uint8)
+        scaled = self._scale_color(color, brightness)
+        np.copyto(self.frame_planes, scaled, casting="unsafe")
 
         # Fade out twinkles
         self.twinkles *= 0.95
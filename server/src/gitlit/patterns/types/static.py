@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 import numpy as np
 
@@ -32,64 +32,71 @@ class StaticPattern(BasePattern):
         ),
     ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="brightness",
-                description="Pattern brightness",
-                parameter_specs=[
-                    Parameter(
-                        name="value",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Brightness value",
-                    ),
-                    Parameter(
-                        name="transition_time",
-                        type=float,
-                        default=0.5,
-                        min_value=0.0,
-                        max_value=5.0,
-                        description="Transition time",
-                        units="s",
-                    ),
-                ],
-                supports_audio=True,
-            )
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="brightness",
+            description="Pattern brightness",
+            parameter_specs=[
+                Parameter(
+                    name="value",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Brightness value",
+                ),
+                Parameter(
+                    name="transition_time",
+                    type=float,
+                    default=0.5,
+                    min_value=0.0,
+                    max_value=5.0,
+                    description="Transition time",
+                    units="s",
+                ),
+            ],
+            supports_audio=True,
+        )
+    ]
 
 
 class SolidPattern(BasePattern):
     """Single solid color across all LEDs"""
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
         self.state.cached_data["last_color"] = [0, 0, 0]
+        self.state.cached_data["last_key"] = None
+        self._last_color_arr = np.zeros(3, dtype=np.uint8)
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate solid color pattern"""
         color = [params.get("red", 0), params.get("green", 0), params.get("blue", 0)]
 
+        # Buffer already holds this color
+        key = tuple(color)
+        if key == self.state.cached_data["last_key"]:
+            return self.frame_buffer
+        self.state.cached_data["last_key"] = key
+
         # Cache current color for transitions
         self.state.cache_value("last_color", color)
 
-        # Fill buffer with color
-        self.frame_buffer.fill(color)
+        # Broadcast the color across the buffer
+        self._last_color_arr[:] = color
+        np.copyto(self.frame_buffer, self._last_color_arr)
         return self.frame_buffer
 
 
 class GradientPattern(BasePattern):
     """Linear gradient between two colors"""
 
-    def __init__(self, led_count: int):
-        super().__init__(led_count)
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
         self.state.cached_data["last_color1"] = [0, 0, 0]
         self.state.cached_data["last_color2"] = [0, 0, 0]
         self.state.cached_data["last_position"] = 0.5
+        self.state.cached_data["last_key"] = None
 
     def _generate(self, time_ms: float, params: Dict[str, Any]) -> np.ndarray:
         """Generate gradient pattern"""
@@ -105,17 +112,22 @@ class GradientPattern(BasePattern):
         ]
         position = params.get("position", 0.5)
 
+        # Buffer already holds this gradient
+        key = (tuple(color1), tuple(color2), position)
+        if key == self.state.cached_data["last_key"]:
+            return self.frame_buffer
+        self.state.cached_data["last_key"] = key
+
         # Cache values for transitions
         self.state.cache_value("last_color1", color1)
         self.state.cache_value("last_color2", color2)
         self.state.cache_value("last_position", position)
 
-        # Generate gradient
-        for i in range(self.led_count):
-            t = i / (self.led_count - 1)
-            t = max(0, min(1, (t - position + 0.5)))
-            self.frame_buffer[i] = [
-                int(color1[j] * (1 - t) + color2[j] * t) for j in range(3)
-            ]
+        # Generate gradient across all LEDs at once
+        t = self._led_index / (self.led_count - 1)
+        np.clip(t - position + 0.5, 0, 1, out=t)
+        c1 = np.array(color1, dtype=np.float64)[:, None]
+        c2 = np.array(color2, dtype=np.float64)[:, None]
+        self.frame_planes[:] = c1 * (1 - t) + c2 * t
 
         return self.frame_buffer
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional, Sequence
 
 import numpy as np
 
@@ -36,91 +36,118 @@ class GradientPattern(BasePattern):
         ),
     ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="color",
-                description="Gradient color properties",
-                parameter_specs=[
-                    Parameter(
-                        name="hue_shift",
-                        type=float,
-                        default=0.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Shift the color hue",
-                    ),
-                    Parameter(
-                        name="saturation",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Color saturation",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-            ModifiableAttribute(
-                name="position",
-                description="Gradient position properties",
-                parameter_specs=[
-                    Parameter(
-                        name="offset",
-                        type=float,
-                        default=0.0,
-                        min_value=-1.0,
-                        max_value=1.0,
-                        description="Position offset",
-                    ),
-                    Parameter(
-                        name="oscillation",
-                        type=float,
-                        default=0.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Position oscillation amount",
-                    ),
-                ],
-                supports_audio=True,
-            ),
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="color",
+            description="Gradient color properties",
+            parameter_specs=[
+                Parameter(
+                    name="hue_shift",
+                    type=float,
+                    default=0.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Shift the color hue",
+                ),
+                Parameter(
+                    name="saturation",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Color saturation",
+                ),
+            ],
+            supports_audio=True,
+        ),
+        ModifiableAttribute(
+            name="position",
+            description="Gradient position properties",
+            parameter_specs=[
+                Parameter(
+                    name="offset",
+                    type=float,
+                    default=0.0,
+                    min_value=-1.0,
+                    max_value=1.0,
+                    description="Position offset",
+                ),
+                Parameter(
+                    name="oscillation",
+                    type=float,
+                    default=0.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Position oscillation amount",
+                ),
+            ],
+            supports_audio=True,
+        ),
+    ]
+
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        # Normalized LED positions, shared by every frame
+        self._t = np.linspace(0, 1, led_count, dtype=np.float32)
+        # Per-frame scratch so the gradient is built without temporaries
+        self._mix = np.empty(led_count, dtype=np.float32)
+        self._w = np.empty(led_count, dtype=np.uint16)
+        self._ramp_key = None
+        self._c1 = np.empty((3, 1), dtype=np.uint16)
+        self._c2 = np.empty((3, 1), dtype=np.uint16)
+
+    def _update_weights(self, position: float, width: float) -> None:
+        """Rebuild the Q8 mix weights for a new gradient position and width"""
+        # Q8 fixed-point weights, 0 is pure color1 and 256 pure color2.
+        # Distances are never negative so only the upper bound needs clamping
+        mix = self._mix
+        np.subtract(self._t, position, out=mix)
+        np.abs(mix, out=mix)
+        mix *= 256 / width
+        np.minimum(mix, 256, out=mix)
+        mix += 0.5
+        np.copyto(self._w, mix, casting="unsafe")
+        self._ramp_key = (position, width)
 
     async def _generate(self, time_ms: float) -> np.ndarray:
         """Generate gradient pattern frame"""
+        params = self.state.parameters
+
         # Get color components from state
-        color1 = np.array(
-            [
-                self.state.parameters.get("color1_r", 0),
-                self.state.parameters.get("color1_g", 0),
-                self.state.parameters.get("color1_b", 0),
-            ],
-            dtype=np.float32,
+        color1 = (
+            params.get("color1_r", 0),
+            params.get("color1_g", 0),
+            params.get("color1_b", 0),
         )
-
-        color2 = np.array(
-            [
-                self.state.parameters.get("color2_r", 0),
-                self.state.parameters.get("color2_g", 0),
-                self.state.parameters.get("color2_b", 0),
-            ],
-            dtype=np.float32,
+        color2 = (
+            params.get("color2_r", 0),
+            params.get("color2_g", 0),
+            params.get("color2_b", 0),
         )
 
         # Get gradient parameters
-        position = self.state.parameters.get("position", 0.5)
-        width = self.state.parameters.get("width", 1.0)
+        position = params.get("position", 0.5)
+        width = params.get("width", 1.0)
+
+        # Buffer already holds this gradient
+        key = (color1, color2, position, width)
+        if key == self.state.cached_data.get("last_key"):
+            return self.frame_buffer
 
-        # Calculate gradient
-        positions = np.linspace(0, 1, self.num_leds)
-        distances = np.abs(positions - position)
-        mix = np.clip(distances / width, 0, 1)
+        # Weights only depend on the ramp shape, not the colors
+        if (position, width) != self._ramp_key:
+            self._update_weights(position, width)
 
-        # Mix colors based on position
-        self.frame_buffer = (
-            color1[None, :] * (1 - mix[:, None]) + color2[None, :] * mix[:, None]
-        ).astype(np.uint8)
+        # Mix colors per channel plane in fixed point
+        self._c1[:, 0] = color1
+        self._c2[:, 0] = color2
+        mixed = self._mix_colors(self._c1, self._c2, self._w)
+        np.copyto(self.frame_planes, mixed, casting="unsafe")
 
+        self.state.cached_data["last_key"] = key
         return self.frame_buffer
+
+    async def _generate_batch(self, times_ms: Sequence[float]) -> np.ndarray:
+        """Repeat the single static frame for every timestamp without copying"""
+        await self._generate(times_ms[0] if len(times_ms) else 0.0)
+        return np.broadcast_to(self._frame_view, (len(times_ms), self.led_count, 3))
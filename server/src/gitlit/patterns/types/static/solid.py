@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional, Sequence
 
 import numpy as np
 import logging
@@ -8,6 +8,12 @@ from ...base import BasePattern, ColorSpec, ModifiableAttribute, Parameter
 logger = logging.getLogger(__name__)
 
 
+def _clip8(value: Any) -> int:
+    """Clamp a color component to 0-255 without a NumPy round trip"""
+    value = int(value)
+    return 0 if value < 0 else (255 if value > 255 else value)
+
+
 class SolidPattern(BasePattern):
     """Single solid color pattern"""
 
@@ -20,42 +26,43 @@ class SolidPattern(BasePattern):
         ColorSpec(name="blue", description="Blue component"),
     ]
 
-    @classmethod
-    @property
-    def modifiable_attributes(cls) -> List[ModifiableAttribute]:
-        return [
-            ModifiableAttribute(
-                name="color",
-                description="Solid color properties",
-                parameter_specs=[
-                    Parameter(
-                        name="hue_shift",
-                        type=float,
-                        default=0.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Shift the color hue",
-                    ),
-                    Parameter(
-                        name="saturation",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Color saturation",
-                    ),
-                    Parameter(
-                        name="brightness",
-                        type=float,
-                        default=1.0,
-                        min_value=0.0,
-                        max_value=1.0,
-                        description="Color brightness",
-                    ),
-                ],
-                supports_audio=True,
-            )
-        ]
+    modifiable_attributes = [
+        ModifiableAttribute(
+            name="color",
+            description="Solid color properties",
+            parameter_specs=[
+                Parameter(
+                    name="hue_shift",
+                    type=float,
+                    default=0.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Shift the color hue",
+                ),
+                Parameter(
+                    name="saturation",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Color saturation",
+                ),
+                Parameter(
+                    name="brightness",
+                    type=float,
+                    default=1.0,
+                    min_value=0.0,
+                    max_value=1.0,
+                    description="Color brightness",
+                ),
+            ],
+            supports_audio=True,
+        )
+    ]
+
+    def __init__(self, led_count: int, frame_buffer: Optional[np.ndarray] = None):
+        super().__init__(led_count, frame_buffer)
+        self._last_color_arr = np.zeros((3, 1), dtype=np.uint8)
 
     def before_generate(self, time_ms: float, params: Dict[str, Any]) -> None:
         """Store parameters in state before generation"""
@@ -67,19 +74,14 @@ class SolidPattern(BasePattern):
         # Update color parameters with validation
         self.state.parameters.update(
             {
-                "red": np.clip(
-                    int(params.get("red", current_params.get("red", 255))), 0, 255
-                ),
-                "green": np.clip(
-                    int(params.get("green", current_params.get("green", 255))), 0, 255
-                ),
-                "blue": np.clip(
-                    int(params.get("blue", current_params.get("blue", 255))), 0, 255
-                ),
+                "red": _clip8(params.get("red", current_params.get("red", 255))),
+                "green": _clip8(params.get("green", current_params.get("green", 255))),
+                "blue": _clip8(params.get("blue", current_params.get("blue", 255))),
             }
         )
 
-        logger.debug(f"Updated state parameters: {self.state.parameters}")
+        # Formatted lazily, only when debug logging is on
+        logger.debug("Updated state parameters: %s", self.state.parameters)
 
     async def _generate(self, time_ms: float) -> np.ndarray:
         """Generate solid color frame"""
@@ -88,8 +90,21 @@ class SolidPattern(BasePattern):
         green = self.state.parameters.get("green", 0)
         blue = self.state.parameters.get("blue", 0)
 
-        # Fill frame buffer with solid color
-        self.frame_buffer.fill(0)
-        self.frame_buffer[:] = [red, green, blue]
+        # Buffer already holds this color
+        color = (red, green, blue)
+        if color == self.state.cached_data.get("last_key"):
+            return self.frame_buffer
+
+        # Broadcast each channel along its contiguous frame plane
+        self._last_color_arr[:, 0] = color
+        np.copyto(self.frame_planes, self._last_color_arr)
 
+        # last_color is shared across transitions, last_key is not
+        self.state.cached_data["last_key"] = color
+        self.state.cached_data["last_color"] = color
         return self.frame_buffer
+
+    async def _generate_batch(self, times_ms: Sequence[float]) -> np.ndarray:
+        """Repeat the single static frame for every timestamp without copying"""
+        await self._generate(times_ms[0] if len(times_ms) else 0.0)
+        return np.broadcast_to(self._frame_view, (len(times_ms), self.led_count, 3))
@@ -3,47 +3,32 @@ import sys
 from pathlib import Path
 import pytest
 import yaml
-import asyncio
+
+# Use libyaml's C emitter when PyYAML was built with it
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 # Configure pytest-asyncio
 pytest.register_assert_rewrite("pytest_asyncio")
 
-# Mark all tests in this directory as async by default
-pytestmark = pytest.mark.asyncio
-
-
-# Configure asyncio for testing
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-# Get the project root directory (server)
-server_dir = Path(__file__).parent.parent.absolute()
 
-# Add server directory to Python path if not already there
-if str(server_dir) not in sys.path:
-    sys.path.insert(0, str(server_dir))
+# Get the source root (server/src) so tests import the `gitlit` package
+src_dir = Path(__file__).parent.parent.absolute() / "src"
 
-# Also add the parent directory to support 'server' package imports
-parent_dir = server_dir.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
+# Add source directory to Python path if not already there
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def led_config():
-    """Default LED configuration for testing"""
+    """Default LED configuration for testing, shared read-only across tests"""
     return {"led_strip": {"count": 60, "pin": 18, "brightness": 1.0, "type": "WS2812B"}}
 
 
-@pytest.fixture
-def config_file(tmp_path, led_config):
-    """Create a temporary config file for testing"""
-    config_path = tmp_path / "led_config.yaml"
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory, led_config):
+    """Create a temporary config file for testing, written once per session"""
+    config_path = tmp_path_factory.mktemp("config") / "led_config.yaml"
     with open(config_path, "w") as f:
-        yaml.dump(led_config, f)
+        yaml.dump(led_config, f, Dumper=YamlDumper)
     return config_path
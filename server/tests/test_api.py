@@ -1,6 +1,7 @@
 """Tests for API endpoints."""
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 from gitlit.api.app import app, init_app
@@ -10,15 +11,15 @@ from gitlit.core.control import SystemController
 from gitlit.core.transactions import TransactionContext, TransactionManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def transaction_manager():
     """Create a test transaction manager"""
     return TransactionManager()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def async_controller(transaction_manager):
-    """Create a test controller for async tests"""
+    """Create a test controller shared by the tests in this module"""
     config = SystemConfig.create_default()
     controller = SystemController(config)
     controller.state_manager.transaction_manager = transaction_manager
@@ -27,30 +28,30 @@ async def async_controller(transaction_manager):
     await controller.stop()
 
 
-@pytest.fixture
-def controller(transaction_manager):
-    """Create a test controller for sync tests"""
-    import asyncio
+@pytest_asyncio.fixture(autouse=True)
+async def reset_controller(async_controller):
+    """Reset the shared controller so every test starts from a fresh state"""
+    await async_controller.reset()
 
-    config = SystemConfig.create_default()
-    controller = SystemController(config)
-    controller.state_manager.transaction_manager = transaction_manager
 
-    # Run start synchronously
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(controller.start())
-    yield controller
-    # Run stop synchronously
-    loop.run_until_complete(controller.stop())
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(async_controller):
     """Create a test client with initialized controller"""
     app = init_app(async_controller)
     return TestClient(app)
 
 
+@pytest_asyncio.fixture
+async def isolated_controller():
+    """Create a controller owned by a single test, for tests that stop it"""
+    config = SystemConfig.create_default()
+    controller = SystemController(config)
+    controller.state_manager.transaction_manager = TransactionManager()
+    await controller.start()
+    yield controller
+    await controller.stop()
+
+
 class TestAPIEndpoints:
     """Test REST API endpoints"""
 
@@ -169,10 +170,11 @@ class TestErrorHandling:
         data = response.json()
         assert "detail" in data
 
-    async def test_system_errors(self, client, async_controller):
+    async def test_system_errors(self, isolated_controller):
         """Test system error handling"""
-        # Stop the system
-        await async_controller.stop()
+        # Stop the system, the shared controller can't be restarted after stop
+        client = TestClient(init_app(isolated_controller))
+        await isolated_controller.stop()
 
         # Try to set pattern while stopped
         response = client.post(
@@ -2,6 +2,7 @@
 
 import asyncio
 import pytest
+import pytest_asyncio
 import numpy as np
 from fastapi.testclient import TestClient
 
@@ -9,7 +10,7 @@ from gitlit.core.config import SystemConfig
 from gitlit.core.control import SystemController
 from gitlit.core.state import SystemState
 from gitlit.core.commands import CommandQueue, SetPatternCommand
-from gitlit.core.frame_manager import FrameManager, FrameMetrics
+from gitlit.core.frame_manager import FrameBuffer, FrameManager, FrameMetrics
 from gitlit.core.exceptions import ValidationError
 
 
@@ -19,15 +20,22 @@ def system_config():
     return SystemConfig.create_default()
 
 
-@pytest.fixture
-async def controller(system_config):
-    """Test system controller"""
-    controller = SystemController(system_config)
+@pytest_asyncio.fixture(scope="module")
+async def shared_controller():
+    """Test system controller, started once per module"""
+    controller = SystemController(SystemConfig.create_default())
     await controller.start()
     yield controller
     await controller.stop()
 
 
+@pytest_asyncio.fixture
+async def controller(shared_controller):
+    """Shared test controller, reset before each test"""
+    await shared_controller.reset()
+    return shared_controller
+
+
 @pytest.fixture
 def frame_manager(system_config):
     """Test frame manager"""
@@ -92,10 +100,9 @@ class TestFrameGeneration:
         """Test basic frame generation"""
         await frame_manager.start()
 
-        # Generate test frame
-        frame, metrics = await frame_manager.generate_frame(
-            lambda t: np.zeros((frame_manager.num_leds, 3), dtype=np.uint8)
-        )
+        # Generate test frame, reusing one buffer instead of allocating per frame
+        buffer = np.zeros((frame_manager.num_leds, 3), dtype=np.uint8)
+        frame, metrics = await frame_manager.generate_frame(lambda t: buffer)
 
         assert frame is not None
         assert frame.shape == (frame_manager.num_leds, 3)
@@ -109,17 +116,70 @@ class TestFrameGeneration:
 
         # Generate and buffer frames
         test_frame = np.zeros((frame_manager.num_leds, 3), dtype=np.uint8)
-        for _ in range(3):
-            success = await frame_manager.write_frame(test_frame.copy(), FrameMetrics())
-            assert success
+        frames = np.broadcast_to(test_frame, (3,) + test_frame.shape)
+        dropped = frame_manager.dropped_frames
+        success = await frame_manager.write_frames_batch(frames)
+
+        # The default ring keeps one slot free, so only one frame fits
+        capacity = frame_manager.primary_buffer.size - 1
+        assert success is False
+        assert frame_manager.dropped_frames == dropped + len(frames) - capacity
 
         # Read frames
         frame, metrics = await frame_manager.read_frame()
         assert frame is not None
         assert frame.shape == test_frame.shape
+        assert isinstance(metrics, FrameMetrics)
+        assert metrics.frame_number == frame_manager.frame_count
+        assert frame_manager.primary_buffer.is_empty()
 
         await frame_manager.stop()
 
+    async def test_frame_buffer_batch(self, system_config):
+        """Test a batch that fits the buffer is written and read back whole"""
+        frame_manager = FrameManager(
+            num_leds=system_config.led.count,
+            target_fps=system_config.performance.target_fps,
+            buffer_size=4,
+        )
+        await frame_manager.start()
+
+        shape = (frame_manager.num_leds, 3)
+        frames = np.arange(3, dtype=np.uint8)[:, None, None] * np.ones(shape, np.uint8)
+        dropped = frame_manager.dropped_frames
+        success = await frame_manager.write_frames_batch(frames)
+        assert success is True
+        assert frame_manager.dropped_frames == dropped
+
+        for expected in range(3):
+            frame, metrics = await frame_manager.read_frame()
+            assert np.all(frame == expected)
+            assert metrics.frame_number == frame_manager.frame_count
+        assert frame_manager.primary_buffer.is_empty()
+
+        await frame_manager.stop()
+
+    def test_frame_buffer_wraparound(self, frame_manager):
+        """Test batched writes wrap around the end of the ring"""
+        buffer = FrameBuffer(size=4)
+        shape = (frame_manager.num_leds, 3)
+        frames = np.arange(5, dtype=np.uint8)[:, None, None] * np.ones(shape, np.uint8)
+        metrics = [FrameMetrics(frame_number=i) for i in range(5)]
+
+        # Advance both indices so the next batch straddles the end of the ring
+        assert buffer.write_frames(frames[:2], metrics[:2]) == 2
+        for _ in range(2):
+            buffer.read_frame()
+
+        assert buffer.write_frames(frames[2:], metrics[2:]) == 3
+        assert buffer.is_full()
+        assert buffer.write_index < buffer.read_index
+        for expected in range(2, 5):
+            frame, frame_metrics = buffer.read_frame()
+            assert np.all(frame == expected)
+            assert frame_metrics.frame_number == expected
+        assert buffer.is_empty()
+
 
 class TestErrorHandling:
     """Test error handling and recovery"""
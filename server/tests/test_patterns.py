@@ -2,17 +2,11 @@
 
 """Tests for pattern functionality."""
 
-import os
-import sys
-import time
+import asyncio
 
-# Add project root to path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-sys.path.append(project_root)
-
-import yaml
 from gitlit.patterns.base import BasePattern
 from gitlit.patterns.engine import PatternEngine
+from gitlit.patterns.transitions import CrossFadeTransition
 from gitlit.patterns.types.static.solid import SolidPattern
 from gitlit.patterns.types.static.gradient import GradientPattern
 from gitlit.patterns.types.moving.wave import WavePattern
@@ -25,6 +19,7 @@ from gitlit.patterns.types.particle.breathe import BreathePattern
 from gitlit.core.exceptions import ValidationError
 
 import pytest
+import pytest_asyncio
 import numpy as np
 
 
@@ -34,76 +29,77 @@ def led_count(led_config):
     return led_config["led_strip"]["count"]
 
 
-async def test_patterns(led_count):
+PATTERNS = [
+    (
+        WavePattern,
+        {"speed": 1.0, "wavelength": 1.0, "red": 255, "green": 0, "blue": 0},
+    ),
+    (RainbowPattern, {"speed": 1.0, "scale": 1.0}),
+    (
+        ChasePattern,
+        {"speed": 1.0, "count": 3, "size": 2, "red": 0, "green": 255, "blue": 0},
+    ),
+    (
+        ScanPattern,
+        {"speed": 1.0, "width": 3, "red": 0, "green": 0, "blue": 255},
+    ),
+    (
+        TwinklePattern,
+        {"density": 0.1, "fade_speed": 1.0, "red": 255, "green": 255, "blue": 255},
+    ),
+    (
+        MeteorPattern,
+        {
+            "speed": 1.0,
+            "size": 3,
+            "trail_length": 0.5,
+            "red": 255,
+            "green": 165,
+            "blue": 0,
+        },
+    ),
+    (
+        BreathePattern,
+        {
+            "speed": 1.0,
+            "min_brightness": 0.0,
+            "max_brightness": 1.0,
+            "red": 255,
+            "green": 0,
+            "blue": 255,
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "pattern_class,params", PATTERNS, ids=[cls.__name__ for cls, _ in PATTERNS]
+)
+async def test_patterns(led_count, pattern_class, params):
     """Test each pattern on the actual LED strip"""
-    patterns = [
-        (
-            WavePattern(led_count),
-            {"speed": 1.0, "wavelength": 1.0, "red": 255, "green": 0, "blue": 0},
-        ),
-        (RainbowPattern(led_count), {"speed": 1.0, "scale": 1.0}),
-        (
-            ChasePattern(led_count),
-            {"speed": 1.0, "count": 3, "size": 2, "red": 0, "green": 255, "blue": 0},
-        ),
-        (
-            ScanPattern(led_count),
-            {"speed": 1.0, "width": 3, "red": 0, "green": 0, "blue": 255},
-        ),
-        (
-            TwinklePattern(led_count),
-            {"density": 0.1, "fade_speed": 1.0, "red": 255, "green": 255, "blue": 255},
-        ),
-        (
-            MeteorPattern(led_count),
-            {
-                "speed": 1.0,
-                "size": 3,
-                "trail_length": 0.5,
-                "red": 255,
-                "green": 165,
-                "blue": 0,
-            },
-        ),
-        (
-            BreathePattern(led_count),
-            {
-                "speed": 1.0,
-                "min_brightness": 0.0,
-                "max_brightness": 1.0,
-                "red": 255,
-                "green": 0,
-                "blue": 255,
-            },
-        ),
-    ]
-
-    try:
-        for pattern, params in patterns:
-            print(f"\nTesting {pattern.__class__.__name__}...")
-            for frame in range(60):  # Run each pattern for 60 frames
-                frame_data = await pattern.generate(frame * 33.3, params)  # ~30fps
-                assert frame_data.shape == (led_count, 3)
-                assert frame_data.dtype == np.uint8
-                assert np.all(frame_data >= 0) and np.all(frame_data <= 255)
-    except Exception as e:
-        print(f"Error testing pattern: {e}")
-        raise
+    pattern = pattern_class(led_count)
+    for frame in range(60):  # Run each pattern for 60 frames
+        frame_data = await pattern.generate(frame * 33, params)  # ~30fps
+        assert frame_data.shape == (led_count, 3)
+        assert frame_data.dtype == np.uint8
+        assert np.all(frame_data >= 0) and np.all(frame_data <= 255)
 
 
 if __name__ == "__main__":
     print("Running pattern tests...")
-    test_patterns()
+    for pattern_class, params in PATTERNS:
+        print(f"Testing {pattern_class.__name__}...")
+        asyncio.run(test_patterns(60, pattern_class, params))
     print("\nTests completed!")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def num_leds():
     """Test LED count"""
     return 60
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def pattern_engine(num_leds):
     """Test pattern engine"""
     engine = PatternEngine(num_leds)
@@ -122,6 +118,26 @@ class TestPatternBase:
         assert pattern.frame_buffer.shape == (num_leds, 3)
         assert pattern.frame_buffer.dtype == np.uint8
 
+    async def test_external_frame_buffer(self, num_leds):
+        """Test pattern writes into a caller-owned frame buffer"""
+        stack = np.zeros((2, num_leds, 3), dtype=np.uint8)
+        pattern = SolidPattern(num_leds, frame_buffer=stack[1])
+        await pattern.update_parameters({"red": 255, "green": 0, "blue": 0})
+
+        await pattern.generate(0)
+        assert np.all(stack[1][:, 0] == 255)
+        assert np.all(stack[0] == 0)
+
+    async def test_generated_frame_is_read_only(self, num_leds):
+        """Test generated frames are borrowed read-only views"""
+        pattern = SolidPattern(num_leds)
+        await pattern.update_parameters({"red": 255, "green": 0, "blue": 0})
+
+        frame = await pattern.generate(0)
+        assert np.shares_memory(frame, pattern.frame_buffer)
+        with pytest.raises(ValueError):
+            frame[0] = 0
+
     async def test_parameter_validation(self, num_leds):
         """Test parameter validation"""
         pattern = SolidPattern(num_leds)
@@ -147,6 +163,18 @@ class TestPatternTypes:
         assert np.all(frame[:, 0] == 255)  # Red channel
         assert np.all(frame[:, 1:] == 0)  # Green and Blue channels
 
+    async def test_solid_pattern_batch(self, num_leds):
+        """Test static patterns repeat one frame across a batch"""
+        pattern = SolidPattern(num_leds)
+        await pattern.update_parameters({"red": 255, "green": 0, "blue": 0})
+
+        frames = await pattern.generate_batch([0, 33, 66])
+        assert frames.shape == (3, num_leds, 3)
+        assert frames.strides[0] == 0  # One frame, broadcast
+        assert np.all(frames[:, :, 0] == 255)
+        with pytest.raises(ValueError):
+            frames[0, 0] = 0
+
     async def test_gradient_pattern(self, num_leds):
         """Test gradient pattern"""
         pattern = GradientPattern(num_leds)
@@ -169,6 +197,18 @@ class TestPatternTypes:
         assert frame[0][0] > frame[-1][0]  # Red decreases
         assert frame[0][2] < frame[-1][2]  # Blue increases
 
+    async def test_gradient_pattern_cache(self, num_leds):
+        """Test gradient is only recomputed when its parameters change"""
+        pattern = GradientPattern(num_leds)
+        await pattern.update_parameters({"color1_r": 255, "color2_b": 255})
+
+        frame = (await pattern.generate(0)).copy()
+        pattern.frame_buffer.fill(0)
+        assert np.all(await pattern.generate(33) == 0)  # Cached, not redrawn
+
+        await pattern.update_parameters({"position": 0.25})
+        assert not np.array_equal(await pattern.generate(66), frame)
+
     async def test_rainbow_pattern(self, num_leds):
         """Test rainbow pattern"""
         pattern = RainbowPattern(num_leds)
@@ -215,6 +255,23 @@ class TestPatternEngine:
         assert pattern_engine.transition_state.source_pattern == "solid"
         assert pattern_engine.transition_state.target_pattern == "gradient"
 
+    def test_crossfade_blend(self, num_leds):
+        """Test crossfade blends uint8 frames and hits both endpoints exactly"""
+        source = np.full((num_leds, 3), 200, dtype=np.uint8)
+        target = np.zeros((num_leds, 3), dtype=np.uint8)
+        transition = CrossFadeTransition()
+
+        assert np.array_equal(transition.apply(source, target, 0.0), source)
+        frame = transition.apply(source, target, 0.5)
+        assert frame.dtype == np.uint8
+        assert np.all(frame == 100)
+        assert np.array_equal(transition.apply(source, target, 1.0), target)
+
+        # Full-scale input at weight 256 must not wrap in the uint16 products
+        full = np.full_like(source, 255)
+        assert np.array_equal(transition.apply(full, target, 0.0), full)
+        assert np.array_equal(transition.apply(target, full, 1.0), full)
+
 
 class TestErrorHandling:
     """Test pattern error handling"""
@@ -10,8 +10,8 @@ if os.path.exists("README.md"):
 setup(
     name="gitlit-server",
     version="0.1.0",
-    packages=find_namespace_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_namespace_packages(where="server/src", include=["gitlit*"]),
+    package_dir={"": "server/src"},
     install_requires=[
         "fastapi>=0.104.1",
         "uvicorn>=0.24.0",
@@ -31,7 +31,7 @@ setup(
             "httpx>=0.24.0",  # Required for FastAPI testing
         ]
     },
-    python_requires=">=3.9",  # Updated to include Python 3.9
+    python_requires=">=3.10",
     author="GitLit Team",
     description="Audio reactive LED pattern server",
     long_description=long_description,
@@ -40,7 +40,6 @@ setup(
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
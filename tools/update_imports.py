@@ -3,36 +3,56 @@
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Pattern, Set, Tuple
 
 
 def find_python_files(directory: str) -> List[Path]:
     """Find all Python files in directory"""
-    return list(Path(directory).rglob("*.py"))
-
-
-def update_imports(file_path: Path, old_prefix: str, new_prefix: str) -> bool:
-    """Update imports in a file"""
-    with open(file_path, "r") as f:
+    return [
+        Path(root) / name
+        for root, _, files in os.walk(directory)
+        for name in files
+        if name.endswith(".py")
+    ]
+
+
+def compile_import_patterns(
+    prefix_map: Dict[str, str]
+) -> List[Tuple[Pattern[bytes], bytes]]:
+    """Compile one import-matching regex per prefix mapping"""
+    patterns = []
+    for old_prefix, new_prefix in prefix_map.items():
+        old = re.escape(old_prefix)
+        pattern = re.compile(
+            rf"from {old}([\w.]+) import|import {old}([\w.]+)".encode()
+        )
+        patterns.append((pattern, new_prefix.encode()))
+    return patterns
+
+
+def update_imports(
+    file_path: Path, patterns: List[Tuple[Pattern[bytes], bytes]]
+) -> bool:
+    """Update imports in a file, returns True if it was rewritten"""
+    with open(file_path, "rb") as f:
         content = f.read()
 
-    # Pattern for matching imports
-    import_pattern = rf"from {old_prefix}([\w.]+) import|import {old_prefix}([\w.]+)"
-
-    # Replace imports
-    new_content = re.sub(
-        import_pattern,
-        lambda m: (
-            f"from {new_prefix}{m.group(1)} import"
-            if m.group(1)
-            else f"import {new_prefix}{m.group(2)}"
-        ),
-        content,
-    )
-
-    if new_content != content:
-        with open(file_path, "w") as f:
-            f.write(new_content)
+    # Replace imports, counting substitutions instead of comparing contents
+    replaced = 0
+    for pattern, new_prefix in patterns:
+        content, count = pattern.subn(
+            lambda m: (
+                b"from " + new_prefix + m.group(1) + b" import"
+                if m.group(1)
+                else b"import " + new_prefix + m.group(2)
+            ),
+            content,
+        )
+        replaced += count
+
+    if replaced:
+        with open(file_path, "wb") as f:
+            f.write(content)
         return True
     return False
 
@@ -55,13 +75,13 @@ def main():
     updated_files: Set[Path] = set()
 
     for directory, prefix_map in mappings.items():
+        patterns = compile_import_patterns(prefix_map)
         python_files = find_python_files(directory)
 
         for file_path in python_files:
-            for old_prefix, new_prefix in prefix_map.items():
-                if update_imports(file_path, old_prefix, new_prefix):
-                    updated_files.add(file_path)
-                    print(f"Updated imports in {file_path}")
+            if update_imports(file_path, patterns):
+                updated_files.add(file_path)
+                print(f"Updated imports in {file_path}")
 
     print(f"\nUpdated {len(updated_files)} files")
 